@@ -124,7 +124,7 @@ def combine_shapes(shapes, refs, order='rc'):
 
 
 def resize_array(data, finalshape, region, window=None,
-                 scale=1, fill=0.0, conserve=True, dtype=None):
+                 scale=1, fill=0.0, conserve=True, dtype=None, out=None):
 
     if window is not None:
         data = data[window]
@@ -137,33 +137,54 @@ def resize_array(data, finalshape, region, window=None,
     if dtype is None:
         dtype = data.dtype
 
-    newdata = numpy.empty(finalshape, dtype=dtype)
-    newdata.fill(fill)
+    if out is None:
+        if fill == 0:
+            # zeros() hands out zeroed pages from the OS, so the
+            # border is never written explicitly
+            newdata = numpy.zeros(finalshape, dtype=dtype)
+        else:
+            newdata = numpy.empty(finalshape, dtype=dtype)
+            newdata.fill(fill)
+    else:
+        # reuse a caller-provided buffer instead of allocating
+        # a full finalshape array per call
+        newdata = out
+        newdata.fill(fill)
     newdata[region] = finaldata
     # Conserve the total sum of the original data
-    if conserve:
-        newdata[region] = newdata[region] / scale**2
+    if conserve and scale != 1:
+        if numpy.issubdtype(newdata.dtype, numpy.inexact):
+            newdata[region] /= scale**2
+        else:
+            # in-place true division is not defined for integer data
+            newdata[region] = newdata[region] / scale**2
     return newdata
 
 
-def resize_arrays(arrays, shape, offsetsp, finalshape, window=None, scale=1, conserve=True, fill=0.0):
-    rarrays = []
-    regions = []
-    for array, rel_offset in zip(arrays, offsetsp):
-        region, _ = subarray_match(finalshape, rel_offset, shape)
-        newdata = resize_array(array, finalshape, region, window=window,
-                               fill=fill, scale=scale, conserve=conserve)
-        rarrays.append(newdata)
-        regions.append(region)
+def resize_arrays(arrays, shape, offsetsp, finalshape, window=None,
+                  scale=1, conserve=True, fill=0.0, nthreads=None):
+    regions = [subarray_match(finalshape, rel_offset, shape)[0]
+               for rel_offset in offsetsp]
+    rarrays = resize_arrays_alt(arrays, regions, finalshape, window=window,
+                                fill=fill, scale=scale, conserve=conserve,
+                                nthreads=nthreads)
     return rarrays, regions
 
 
-def resize_arrays_alt(arrays, regions, finalshape, window=None, scale=1, conserve=True, fill=0.0):
-    rarrays = []
-    for array, region in zip(arrays, regions):
-        newdata = resize_array(array, finalshape, region, window=window,
-                               fill=fill, scale=scale, conserve=conserve)
-        rarrays.append(newdata)
+def resize_arrays_alt(arrays, regions, finalshape, window=None,
+                      scale=1, conserve=True, fill=0.0, nthreads=None):
+    def _resize_one(array, region):
+        return resize_array(array, finalshape, region, window=window,
+                            fill=fill, scale=scale, conserve=conserve)
+
+    if nthreads is not None and nthreads > 1:
+        # Each frame is independent, overlap the per-frame copies
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=nthreads) as executor:
+            rarrays = list(executor.map(_resize_one, arrays, regions))
+    else:
+        rarrays = [_resize_one(array, region)
+                   for array, region in zip(arrays, regions)]
     return rarrays
 
 
@@ -217,50 +238,78 @@ def fixpix2(data, mask, iterations=3, out=None):
 
     # Structure for dilation is 8-way
     stct = ndimage.generate_binary_structure(2, 2)
-    # Pixels in the background
-    back = lblarr == 0
+    # Bounding box of each object, computed once
+    # Every mask operation below works on a window around the
+    # object instead of the full image, so the per-object cost
+    # depends on the size of the defect, not on the frame size
+    slices = ndimage.find_objects(lblarr)
+    # Bounding boxes expanded by the dilation radius,
+    # clipped to the image
+    windows = [tuple(slice(max(sl.start - iterations, 0),
+                           min(sl.stop + iterations, axis))
+                     for sl, axis in zip(slc, lblarr.shape))
+               for slc in slices]
+
+    if labl == 0:
+        return out
+
+    # Scratch buffers sized to the largest window, sliced and
+    # refilled per object instead of reallocated in the loop
+    mshape = tuple(max(w[i].stop - w[i].start for w in windows)
+                   for i in range(2))
+    segm_buf = numpy.empty(mshape, dtype=bool)
+    scrt_buf = numpy.empty(mshape, dtype=bool)
+    more_buf = numpy.empty(mshape, dtype=bool)
     # For each object
     for idx in range(1, labl + 1):
+        window = windows[idx - 1]
+        wshape = tuple(sl.stop - sl.start for sl in window)
+        lblvw = lblarr[window]
+        outvw = out[window]
+        segm = segm_buf[:wshape[0], :wshape[1]]
+        scrt = scrt_buf[:wshape[0], :wshape[1]]
+        more = more_buf[:wshape[0], :wshape[1]]
         # Pixels of the object
-        segm = lblarr == idx
+        numpy.equal(lblvw, idx, out=segm)
         # Pixels of the object or the background
         # dilation will only touch these pixels
-        dilmask = numpy.logical_or(back, segm)
+        numpy.equal(lblvw, 0, out=scrt)
+        numpy.logical_or(scrt, segm, out=scrt)
         # Dilation 3 times
-        more = ndimage.binary_dilation(segm, stct,
-                                       iterations=iterations,
-                                       mask=dilmask)
+        ndimage.binary_dilation(segm, stct,
+                                iterations=iterations,
+                                mask=scrt, output=more)
         # Border pixels
         # Pixels in the border around the object are
         # more and (not segm)
-        border = numpy.logical_and(more, numpy.logical_not(segm))
+        numpy.logical_not(segm, out=scrt)
+        border = numpy.logical_and(more, scrt, out=more)
         # Pixels in the border
         xi, yi = border.nonzero()
         # Bilinear leastsq calculator
-        calc = FitOne(xi, yi, out[xi, yi])
+        calc = FitOne(xi, yi, outvw[xi, yi])
         # Pixels in the region
         xi, yi = segm.nonzero()
         # Value is obtained from the fit
-        out[segm] = calc(xi, yi)
+        outvw[segm] = calc(xi, yi)
 
     return out
 
 
-def correct_dark(data, dark, dtype='float32'):
-    result = data - dark
-    result = result.astype(dtype)
+def correct_dark(data, dark, dtype='float32', out=None):
+    # Subtract directly in the output dtype, a single pass
+    # instead of a full-precision temporary plus an astype copy
+    result = numpy.subtract(data, dark, dtype=dtype, out=out)
     return result
 
 
-def correct_flatfield(data, flat, dtype='float32'):
-    result = data / flat
-    result = result.astype(dtype)
+def correct_flatfield(data, flat, dtype='float32', out=None):
+    result = numpy.divide(data, flat, dtype=dtype, out=out)
     return result
 
 
-def correct_sky(data, sky, dtype='float32'):
-    result = data - sky
-    result = result.astype(dtype)
+def correct_sky(data, sky, dtype='float32', out=None):
+    result = numpy.subtract(data, sky, dtype=dtype, out=out)
     return result
 
 
@@ -271,20 +320,55 @@ def correct_nonlinearity(data, polynomial, dtype='float32'):
 
 
 def compute_sky_advanced(data, omasks):
-    from numina.array.combine import median
     d = data[0]
     m = omasks[0]
-    median_sky = numpy.median(d[m == 0])
-    result = numpy.zeros(data[0].shape)
-    result += median_sky
-    return result
+    median_sky = _masked_median(d, m)
+    return numpy.full(d.shape, median_sky)
+
+
+def _masked_median(data, mask):
+    """Median of the unmasked pixels, without a second internal copy.
+
+    The boolean compression already yields a fresh buffer, so the
+    median can select in place instead of copying again.
+    """
+    valid = data[mask == 0]
+    return numpy.median(valid, overwrite_input=True)
 
 
 def compute_median_background(img, omask, region):
-    d = img[region]
-    m = omask[region]
-    median_sky = numpy.median(d[m == 0])
-    return median_sky
+    return _masked_median(img[region], omask[region])
+
+
+def median_axis0(arrays, masks=None, out=None):
+    """Per-pixel median of a stack of frames.
+
+    Delegate to the compiled combine kernel, which selects the median
+    of each pixel column directly and honours bad-pixel masks without
+    the Python-level overhead of `numpy.ma`.
+
+    :param arrays: a sequence of 2D frames of the same shape
+    :param masks: optional sequence of masks, nonzero marks bad pixels
+    :param out: optional (3, shape) output buffer, as in :mod:`numina.array.combine`
+    :return: 2D array with the per-pixel median
+    """
+    from .combine import median
+    return median(arrays, masks=masks, out=out)[0]
+
+
+def extinction_scales(airmasses, extinction):
+    """Flux scale factors that undo atmospheric extinction.
+
+    Evaluate ``10 ** (0.4 * airmass * extinction)`` for a whole set of
+    frames in one vectorized expression, suitable as the ``scales``
+    argument of the combine routines.
+
+    :param airmasses: sequence with the airmass of each frame
+    :param extinction: extinction coefficient, in magnitudes per airmass
+    :return: 1D array with one multiplicative scale per frame
+    """
+    airmasses = numpy.asarray(airmasses, dtype='float64')
+    return numpy.power(10.0, 0.4 * extinction * airmasses)
 
 
 def numberarray(x, shape):
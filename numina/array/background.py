@@ -15,7 +15,6 @@
 
 import numpy
 import scipy.ndimage as ndimage
-import scipy.ndimage.filters as ndfilter
 
 
 def _interpolation(z, sx, sy, mx, my):
@@ -34,6 +33,25 @@ def _interpolation(z, sx, sy, mx, my):
     return newf
 
 
+def smooth_fft_lowpass(data, sigma):
+    """Keep only the low spatial frequencies of a 2D array.
+
+    The array is multiplied in Fourier space by a Gaussian low-pass
+    mask equivalent to a convolution with a Gaussian of standard
+    deviation *sigma* pixels (with periodic boundaries). For large
+    smoothing scales, such as flat-field gain variations, this runs in
+    O(N log N) instead of the O(N sigma) of a direct convolution.
+    """
+    ny, nx = data.shape
+    fx = numpy.fft.rfftfreq(nx)
+    fy = numpy.fft.fftfreq(ny)
+    mask = numpy.exp(-2 * (numpy.pi * sigma) ** 2 *
+                     (fy[:, numpy.newaxis] ** 2 + fx[numpy.newaxis, :] ** 2))
+    fdata = numpy.fft.rfft2(data)
+    fdata *= mask
+    return numpy.fft.irfft2(fdata, s=data.shape)
+
+
 def background_estimator(bdata):
     """Estimate the background in a 2D array"""
 
@@ -82,7 +100,7 @@ def create_background_map(data, bsx, bsy):
     z = numpy.array(comp)
     z.shape = (mx, my)
     # median filter
-    ndfilter.median_filter(z, size=(3, 3), output=z)
+    ndimage.median_filter(z, size=(3, 3), output=z)
 
     # Interpolate to the original size
     new = _interpolation(z, sx, sy, mx, my)
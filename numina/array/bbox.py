@@ -39,6 +39,8 @@ class PixelInterval1D(object):
         self.ndim = 1
         self.axis = axis
         self._empty = (self.pix2 == self.pix1)
+        # the interval is immutable, build its slice only once
+        self._slice = slice(pix1, pix2)
 
     @property
     def shape(self):
@@ -46,7 +48,7 @@ class PixelInterval1D(object):
 
     @property
     def slice(self):
-        return slice(self.pix1, self.pix2)
+        return self._slice
 
     @classmethod
     def from_coordinates(cls, x1, x2):
@@ -118,14 +120,20 @@ class PixelInterval(object):
     def __init__(self, *args):
         self.ndim = len(args)
         self.intervals = [PixelInterval1D(a, b, axis) for axis, (a, b) in enumerate(args)]
+        self._shape = None
+        self._slice = None
 
     @property
     def shape(self):
-        return tuple(intl.shape for intl in self.intervals)
+        if self._shape is None:
+            self._shape = tuple(intl.shape for intl in self.intervals)
+        return self._shape
 
     @property
     def slice(self):
-        return tuple(intl.slice for intl in self.intervals)
+        if self._slice is None:
+            self._slice = tuple(intl.slice for intl in self.intervals)
+        return self._slice
 
     @classmethod
     def pixel_range(cls, *args):
@@ -145,6 +153,8 @@ class PixelInterval(object):
         for idx, intl in enumerate(result.intervals):
             intl.axis = idx
         result.ndim = len(result.intervals)
+        result._shape = None
+        result._slice = None
         return result
 
     def union(self, other):
@@ -47,7 +47,13 @@ def process_bpm(method, arr, mask, hwin=2, wwin=2, fill=0, reuse_values=False, s
     out = numpy.empty_like(narr, dtype='double')
 
     # Casting, Cython doesn't support well type bool
-    cmask = numpy.where(mask > 0, 1, 0).astype('uint8')
+    # the kernel only distinguishes zero from nonzero, so a uint8 mask
+    # can be used as-is; other dtypes are thresholded without the
+    # intermediate int64 array that numpy.where would build
+    if mask.dtype == numpy.uint8:
+        cmask = mask
+    else:
+        cmask = (mask > 0).astype('uint8')
 
     _, proc = _process_bpm_intl(method, narr, cmask, out, hwin=hwin, wwin=wwin, fill=fill, reuse_values=reuse_values)
     if subs:
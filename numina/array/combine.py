@@ -257,9 +257,17 @@ def generic_combine(method, arrays, masks=None, dtype=None,
     :return: median, variance of the median and number of points stored
     """
 
-    arrays = [numpy.asarray(arr, dtype=dtype) for arr in arrays]
+    if isinstance(arrays, numpy.ndarray) and arrays.ndim == 3:
+        # A stacked 3D array: the frames are contiguous views over
+        # one buffer, so no per-frame copy is needed
+        arrays = list(numpy.asarray(arrays, dtype=dtype))
+    else:
+        arrays = [numpy.asarray(arr, dtype=dtype) for arr in arrays]
     if masks is not None:
-        masks = [numpy.asarray(msk) for msk in masks]
+        if isinstance(masks, numpy.ndarray) and masks.ndim == 3:
+            masks = list(masks)
+        else:
+            masks = [numpy.asarray(msk) for msk in masks]
 
     if out is None:
         # Creating out if needed
@@ -279,3 +287,35 @@ def generic_combine(method, arrays, masks=None, dtype=None,
         masks, zeros, scales, weights
     )
     return out
+
+
+def tiled_combine(method, arrays, masks=None, dtype=None, out=None,
+                  zeros=None, scales=None, weights=None, tilerows=512):
+    """Stack arrays in horizontal tiles to bound peak memory.
+
+    Equivalent to :func:`generic_combine`, but the frames are processed
+    in blocks of `tilerows` rows. When the inputs are memory mapped
+    only one tile per frame is materialised at a time, so the resident
+    set is N x tilerows x columns instead of N full frames.
+
+    :param method: the combination method
+    :param arrays: a list of arrays
+    :param masks: a list of mask arrays, True values are masked
+    :param dtype: data type of the output
+    :param out: optional output, with one more axis than the input arrays
+    :param tilerows: number of rows processed per tile
+    :return: median, variance of the median and number of points stored
+    """
+    shape = arrays[0].shape
+
+    if out is None:
+        out = numpy.zeros((3,) + tuple(shape), dtype)
+
+    for row0 in range(0, shape[0], tilerows):
+        tile = slice(row0, min(row0 + tilerows, shape[0]))
+        subarrays = [arr[tile] for arr in arrays]
+        submasks = None if masks is None else [msk[tile] for msk in masks]
+        generic_combine(method, subarrays, masks=submasks, dtype=dtype,
+                        out=out[:, tile], zeros=zeros, scales=scales,
+                        weights=weights)
+    return out
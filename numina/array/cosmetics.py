@@ -96,7 +96,8 @@ def ccdmask(flat1, flat2=None, mask=None, lowercut=6.0, uppercut=6.0,
         flat1 = numpy.ones_like(flat2)
 
     if mask is None:
-        mask = numpy.zeros_like(flat1, dtype='int')
+        # mask values are small flags, one byte per pixel is enough
+        mask = numpy.zeros_like(flat1, dtype='uint8')
 
     ratio = numpy.zeros_like(flat1)
     invalid = numpy.zeros_like(flat1)
@@ -123,7 +124,7 @@ def ccdmask(flat1, flat2=None, mask=None, lowercut=6.0, uppercut=6.0,
 
     if mode == 'region':
         _logger.info('computing median in boxes of %r', nmed)
-        ratio_med = scipy.ndimage.filters.median_filter(ratio, size=nmed)
+        ratio_med = scipy.ndimage.median_filter(ratio, size=nmed)
         # subtracting the median map
         ratio[gmask] -= ratio_med[gmask]
     else:
@@ -256,7 +257,7 @@ def cosmetics(flat1, flat2 = None, mask=None, lowercut=6.0, uppercut=6.0, siglev
         flat1 = numpy.ones_like(flat2)
 
     if type(mask) is not numpy.ndarray:
-        mask=numpy.zeros(flat1.shape,dtype='int')
+        mask=numpy.zeros(flat1.shape,dtype='uint8')
 
     ratio, mask = comp_ratio(flat1, flat2, mask)
     fratio1 = ratio[~mask]
@@ -12,7 +12,11 @@
 from __future__ import division
 from __future__ import print_function
 
+import math
+
 import numpy as np
+from numpy.polynomial import polynomial
+from scipy import ndimage
 from skimage import transform
 
 from numina.array._clippix import _resample
@@ -22,6 +26,38 @@ from numina.array.display.ximplotxy import ximplotxy
 NMAX_ORDER = 4
 
 
+def _design_matrix(x, y, order):
+    """Least-squares design matrix of the 2D polynomial transformation.
+
+    Column k holds x**(i-j) * y**j with the coefficient ordering of
+    :func:`fmap`. The powers are built by incremental multiplication
+    and reused across columns, and the matrix is filled column-wise
+    into a Fortran-ordered buffer, which is what the LAPACK solver
+    consumes.
+    """
+    npoints = len(x)
+    ncoef = ncoef_fmap(order)
+
+    xp = [np.ones(npoints)]
+    yp = [xp[0]]
+    for _ in range(order):
+        xp.append(xp[-1] * x)
+        yp.append(yp[-1] * y)
+
+    a_matrix = np.empty((npoints, ncoef), order='F')
+    k = 0
+    for i in range(order + 1):
+        for j in range(i + 1):
+            if j == 0:
+                a_matrix[:, k] = xp[i]
+            elif j == i:
+                a_matrix[:, k] = yp[j]
+            else:
+                a_matrix[:, k] = xp[i - j] * yp[j]
+            k += 1
+    return a_matrix
+
+
 def compute_distortion(x_orig, y_orig, x_rect, y_rect, order, debugplot):
     """Compute image distortion transformation.
 
@@ -66,60 +102,22 @@ def compute_distortion(x_orig, y_orig, x_rect, y_rect, order, debugplot):
 
     # normalize ranges dividing by the maximum, so that the transformation
     # fit will be computed with data points with coordinates in the range [0,1]
-    x_scale = 1.0 / np.concatenate((x_orig, x_rect)).max()
-    y_scale = 1.0 / np.concatenate((y_orig, y_rect)).max()
+    x_scale = 1.0 / max(np.max(x_orig), np.max(x_rect))
+    y_scale = 1.0 / max(np.max(y_orig), np.max(y_rect))
     x_orig_scaled = x_orig * x_scale
     y_orig_scaled = y_orig * y_scale
     x_inter_scaled = x_rect * x_scale
     y_inter_scaled = y_rect * y_scale
 
     # solve 2 systems of equations with half number of unknowns each
-    if order == 1:
-        a_matrix = np.vstack([np.ones(npoints),
-                              x_inter_scaled,
-                              y_inter_scaled]).T
-    elif order == 2:
-        a_matrix = np.vstack([np.ones(npoints),
-                              x_inter_scaled,
-                              y_inter_scaled,
-                              x_inter_scaled ** 2,
-                              x_inter_scaled * y_orig_scaled,
-                              y_inter_scaled ** 2]).T
-    elif order == 3:
-        a_matrix = np.vstack([np.ones(npoints),
-                              x_inter_scaled,
-                              y_inter_scaled,
-                              x_inter_scaled ** 2,
-                              x_inter_scaled * y_orig_scaled,
-                              y_inter_scaled ** 2,
-                              x_inter_scaled ** 3,
-                              x_inter_scaled ** 2 * y_inter_scaled,
-                              x_inter_scaled * y_inter_scaled ** 2,
-                              y_inter_scaled ** 3]).T
-    elif order == 4:
-        a_matrix = np.vstack([np.ones(npoints),
-                              x_inter_scaled,
-                              y_inter_scaled,
-                              x_inter_scaled ** 2,
-                              x_inter_scaled * y_orig_scaled,
-                              y_inter_scaled ** 2,
-                              x_inter_scaled ** 3,
-                              x_inter_scaled ** 2 * y_inter_scaled,
-                              x_inter_scaled * y_inter_scaled ** 2,
-                              y_inter_scaled ** 3,
-                              x_inter_scaled ** 4,
-                              x_inter_scaled ** 3 * y_inter_scaled ** 1,
-                              x_inter_scaled ** 2 * y_inter_scaled ** 2,
-                              x_inter_scaled ** 1 * y_inter_scaled ** 3,
-                              y_inter_scaled ** 4]).T
-    else:
-        raise ValueError("Invalid order=" + str(order))
-    poltrans = transform.PolynomialTransform(
-        np.vstack(
-            [np.linalg.lstsq(a_matrix, x_orig_scaled, rcond=None)[0],
-             np.linalg.lstsq(a_matrix, y_orig_scaled, rcond=None)[0]]
-        )
-    )
+    a_matrix = _design_matrix(x_inter_scaled, y_inter_scaled, order)
+    # one factorization of a_matrix serves both coordinates: stack the
+    # right-hand sides instead of solving the same system twice
+    solution = np.linalg.lstsq(
+        a_matrix, np.column_stack((x_orig_scaled, y_orig_scaled)),
+        rcond=None
+    )[0]
+    poltrans = transform.PolynomialTransform(solution.T)
 
     # reverse normalization to recover coefficients of the
     # transformation in the correct system
@@ -142,22 +140,22 @@ def compute_distortion(x_orig, y_orig, x_rect, y_rect, order, debugplot):
                        show=False,
                        **{'marker': 'o',
                           'label': '(u,v) coordinates', 'linestyle': ''})
-        dum = list(zip(x_orig_scaled, y_orig_scaled))
-        for idum in range(len(dum)):
-            ax.text(dum[idum][0], dum[idum][1], str(idum + 1), fontsize=10,
+        for idum, (xdum, ydum) in enumerate(zip(x_orig_scaled,
+                                                y_orig_scaled)):
+            ax.text(xdum, ydum, str(idum + 1), fontsize=10,
                     horizontalalignment='center',
                     verticalalignment='bottom', color='black')
         ax.plot(x_inter_scaled, y_inter_scaled, 'o',
                 label="(x,y) coordinates")
-        dum = list(zip(x_inter_scaled, y_inter_scaled))
-        for idum in range(len(dum)):
-            ax.text(dum[idum][0], dum[idum][1], str(idum + 1), fontsize=10,
+        for idum, (xdum, ydum) in enumerate(zip(x_inter_scaled,
+                                                y_inter_scaled)):
+            ax.text(xdum, ydum, str(idum + 1), fontsize=10,
                     horizontalalignment='center',
                     verticalalignment='bottom', color='grey')
-        xmin = np.concatenate((x_orig_scaled, x_inter_scaled)).min()
-        xmax = np.concatenate((x_orig_scaled, x_inter_scaled)).max()
-        ymin = np.concatenate((y_orig_scaled, y_inter_scaled)).min()
-        ymax = np.concatenate((y_orig_scaled, y_inter_scaled)).max()
+        xmin = min(x_orig_scaled.min(), x_inter_scaled.min())
+        xmax = max(x_orig_scaled.max(), x_inter_scaled.max())
+        ymin = min(y_orig_scaled.min(), y_inter_scaled.min())
+        ymax = max(y_orig_scaled.max(), y_inter_scaled.max())
         dx = xmax - xmin
         xmin -= dx / 20
         xmax += dx / 20
@@ -175,6 +173,21 @@ def compute_distortion(x_orig, y_orig, x_rect, y_rect, order, debugplot):
     return aij, bij
 
 
+def _fmap_matrix(cij, order):
+    """Triangular coefficient matrix for polyval2d.
+
+    Entry [p, q] holds the coefficient of x**p * y**q, translated
+    from the flat c_ij ordering of :func:`fmap`.
+    """
+    cmat = np.zeros((order + 1, order + 1))
+    k = 0
+    for i in range(order + 1):
+        for j in range(i + 1):
+            cmat[i - j, j] = cij[k]
+            k += 1
+    return cmat
+
+
 def fmap(order, aij, bij, x, y):
     """Evaluate the 2D polynomial transformation.
 
@@ -205,15 +218,12 @@ def fmap(order, aij, bij, x, y):
 
     """
 
-    u = np.zeros_like(x)
-    v = np.zeros_like(y)
+    # polyval2d expects matching shapes; broadcasting produces views,
+    # so sparse coordinate grids stay cheap
+    xf, yf = np.broadcast_arrays(np.asarray(x), np.asarray(y))
 
-    k = 0
-    for i in range(order + 1):
-        for j in range(i + 1):
-            u += aij[k] * (x ** (i - j)) * (y ** j)
-            v += bij[k] * (x ** (i - j)) * (y ** j)
-            k += 1
+    u = polynomial.polyval2d(xf, yf, _fmap_matrix(aij, order))
+    v = polynomial.polyval2d(xf, yf, _fmap_matrix(bij, order))
 
     return u, v
 
@@ -233,11 +243,8 @@ def ncoef_fmap(order):
 
     """
 
-    ncoef = 0
-    for i in range(order + 1):
-        for j in range(i + 1):
-            ncoef += 1
-    return ncoef
+    # triangular count: one coefficient per (i, j) with 0 <= j <= i
+    return (order + 1) * (order + 2) // 2
 
 
 def order_fmap(ncoef):
@@ -255,15 +262,11 @@ def order_fmap(ncoef):
 
     """
 
-    loop = True
-    order = 1
-    while loop:
-        loop = not (ncoef == ncoef_fmap(order))
-        if loop:
-            order += 1
-            if order > NMAX_ORDER:
-                print('No. of coefficients: ', ncoef)
-                raise ValueError("order > " + str(NMAX_ORDER) + " not implemented")
+    # invert ncoef = (order + 1) * (order + 2) / 2 in closed form
+    order = int(round((-3 + math.sqrt(1 + 8 * ncoef)) / 2))
+    if order < 1 or order > NMAX_ORDER or ncoef != ncoef_fmap(order):
+        print('No. of coefficients: ', ncoef)
+        raise ValueError("order > " + str(NMAX_ORDER) + " not implemented")
     return order
 
 
@@ -286,7 +289,8 @@ def rectify2d(image2d, aij, bij, resampling,
     bij : 1d numpy array
         Coefficients b_ij of the transformation.
     resampling : int
-        1: nearest neighbour, 2: flux preserving interpolation.
+        1: nearest neighbour, 2: flux preserving interpolation,
+        3: cubic spline interpolation.
     naxis1out : int or None
         X-axis dimension of output image.
     naxis2out : int or None
@@ -331,33 +335,30 @@ def rectify2d(image2d, aij, bij, resampling,
         ioffy = 0
 
     if resampling == 1:
-        # pixel coordinates (rectified image); since the fmap function
-        # below requires floats, these arrays must use dtype=np.float
-        j = np.arange(0, naxis1out, dtype=np.float) - ioffx
-        i = np.arange(0, naxis2out, dtype=np.float) - ioffy
-        # the cartesian product of the previous 1D arrays could be stored
-        # as np.transpose([xx,yy]), where xx and yy are computed as follows
-        xx = np.tile(j, (len(i),))
-        yy = np.repeat(i, len(j))
+        # pixel coordinates (rectified image) as a sparse grid: a row
+        # and a column vector that fmap combines through broadcasting,
+        # so the full cartesian product is never materialised
+        j = np.arange(0, naxis1out, dtype=float) - ioffx
+        i = (np.arange(0, naxis2out, dtype=float) - ioffy).reshape(-1, 1)
         # compute pixel coordinates in original (distorted) image
-        xxx, yyy = fmap(order, aij, bij, xx, yy)
+        xxx, yyy = fmap(order, aij, bij, j, i)
         # round to nearest integer and cast to integer; note that the
         # rounding still provides a float, so the casting is required
-        ixxx = np.rint(xxx).astype(np.int)
-        iyyy = np.rint(yyy).astype(np.int)
-        # determine pixel coordinates within available image
-        lxxx = np.logical_and(ixxx >= 0, ixxx < naxis1)
-        lyyy = np.logical_and(iyyy >= 0, iyyy < naxis2)
-        lok = np.logical_and(lxxx, lyyy)
-        # assign pixel values to rectified image
-        ixx = xx.astype(np.int)[lok]
-        iyy = yy.astype(np.int)[lok]
-        ixxx = ixxx[lok]
-        iyyy = iyyy[lok]
+        ixxx = np.rint(xxx).astype(int)
+        iyyy = np.rint(yyy).astype(int)
+        # determine pixel coordinates within available image,
+        # accumulating the bound checks into a single mask buffer
+        lok = np.empty(ixxx.shape, dtype=bool)
+        np.logical_and(ixxx >= 0, ixxx < naxis1, out=lok)
+        np.logical_and(lok, iyyy >= 0, out=lok)
+        np.logical_and(lok, iyyy < naxis2, out=lok)
         # initialize result
-        image2d_rect = np.zeros((naxis2out, naxis1out), dtype=np.float)
-        # rectified image
-        image2d_rect[iyy + ioffy, ixx + ioffx] = image2d[iyyy, ixxx]
+        image2d_rect = np.zeros((naxis2out, naxis1out), dtype=float)
+        # rectified image: a single flat gather/scatter; the mask has
+        # the shape of the output, so its flat indices address it
+        src_idx = np.ravel_multi_index((iyyy[lok], ixxx[lok]),
+                                       (naxis2, naxis1))
+        image2d_rect.flat[np.flatnonzero(lok)] = image2d.flat[src_idx]
     elif resampling == 2:
         # coordinates (rectified image) of the four corners, sorted in
         # anticlockwise order, of every pixel
@@ -378,8 +379,20 @@ def rectify2d(image2d, aij, bij, resampling,
         iyy = np.tile(np.arange(naxis2out), (naxis1out,))
         # rectified image (using cython function)
         image2d_rect = _resample(image2d, xxx, yyy, ixx, iyy, naxis1out, naxis2out)
+    elif resampling == 3:
+        # pixel coordinates (rectified image) as a sparse grid; see
+        # the nearest neighbour branch
+        j = np.arange(0, naxis1out, dtype=float) - ioffx
+        i = (np.arange(0, naxis2out, dtype=float) - ioffy).reshape(-1, 1)
+        # compute pixel coordinates in original (distorted) image
+        xxx, yyy = fmap(order, aij, bij, j, i)
+        # cubic interpolation through scipy's C implementation;
+        # pixels mapped outside the original image are set to zero
+        image2d_rect = ndimage.map_coordinates(
+            image2d, [yyy, xxx], order=3, mode='constant', cval=0.0
+        )
     else:
-        raise ValueError("Sorry, resampling method must be 1 or 2")
+        raise ValueError("Sorry, resampling method must be 1, 2 or 3")
 
     # return result
     return image2d_rect
@@ -397,7 +410,8 @@ def shift_image2d(image2d, xoffset=0.0, yoffset=0.0, resampling=2):
     yoffset : float
         Offset in the Y direction.
     resampling : int
-        1: nearest neighbour, 2: flux preserving interpolation.
+        1: nearest neighbour, 2: flux preserving interpolation,
+        3: cubic spline interpolation.
 
     Returns
     -------
@@ -432,7 +446,8 @@ def rotate_image2d(image2d, theta_deg, xcenter, ycenter, fscale=1.0, resampling=
     fscale : float
         Scale factor (1.0: no change in scale).
     resampling : int
-        1: nearest neighbour, 2: flux preserving interpolation.
+        1: nearest neighbour, 2: flux preserving interpolation,
+        3: cubic spline interpolation.
 
     Returns
     -------
@@ -0,0 +1,63 @@
+#
+# Copyright 2021 Universidad Complutense de Madrid
+#
+# This file is part of Numina
+#
+# SPDX-License-Identifier: GPL-3.0+
+# License-Filename: LICENSE.txt
+#
+
+"""Image registration by phase correlation."""
+
+import numpy
+import scipy.fft
+
+
+def phase_correlation(reference, image):
+    """Estimate the translation between two images.
+
+    Compute the phase correlation of the two images, the inverse
+    transform of their magnitude-normalized cross-power spectrum, and
+    locate its peak. The returned offset is the integer pixel
+    displacement of *image* with respect to *reference*, in
+    (row, column) order; shifting the image back by this amount aligns
+    the two images.
+
+    This runs in O(N log N) regardless of the size of the shift, so it
+    can refine nominal telescope offsets without detecting and matching
+    individual objects.
+
+    Parameters
+    ----------
+    reference : 2d numpy array
+        Reference image.
+    image : 2d numpy array
+        Image to register against the reference. Must have the same
+        shape as the reference.
+
+    Returns
+    -------
+    offset : tuple of int
+        Displacement (row, column) of *image* relative to *reference*.
+
+    """
+    if reference.shape != image.shape:
+        raise ValueError('reference and image must have the same shape')
+
+    shape = reference.shape
+    # round up to fast FFT sizes
+    fshape = tuple(scipy.fft.next_fast_len(s) for s in shape)
+    f_ref = scipy.fft.rfft2(reference, s=fshape)
+    f_img = scipy.fft.rfft2(image, s=fshape)
+    cross = f_img * f_ref.conj()
+    # keep only the phase of the cross-power spectrum: the whitening
+    # stops bright extended structure from biasing the peak towards
+    # the image energy
+    cross /= numpy.abs(cross) + 1.0e-15
+    xcorr = scipy.fft.irfft2(cross, s=fshape)
+
+    peak = numpy.unravel_index(numpy.argmax(xcorr), fshape)
+    # peaks beyond the half size are negative shifts, wrapped around
+    offset = tuple(p - f if p > f // 2 else p
+                   for p, f in zip(peak, fshape))
+    return offset
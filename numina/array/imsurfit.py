@@ -135,14 +135,25 @@ class FitOne(object):
         x -= self.xm
         y -= self.ym
 
-        aa = numpy.zeros(shape=(3, 3))
-        aa[0, 0] = 1
-        aa[1, 1] = (x*x).mean()
-        aa[2, 2] = (y*y).mean()
-        aa[1, 2] = aa[2, 1] = (x*y).mean()
-        bb = [z.mean(), (x*z).mean(), (y*z).mean()]
-
-        self.pf = numpy.linalg.solve(aa, bb)
+        # with centered coordinates the normal equations decouple:
+        # the constant term is the mean of z and the linear terms
+        # reduce to a 2x2 system, solved in closed form instead of
+        # paying the LAPACK dispatch per fit
+        sxx = (x*x).mean()
+        syy = (y*y).mean()
+        sxy = (x*y).mean()
+        bx = (x*z).mean()
+        by = (y*z).mean()
+
+        det = sxx * syy - sxy * sxy
+        if det == 0:
+            raise numpy.linalg.LinAlgError('Singular matrix')
+
+        self.pf = numpy.array([
+            z.mean(),
+            (syy * bx - sxy * by) / det,
+            (sxx * by - sxy * bx) / det,
+        ])
 
     def __call__(self, x, y):
         xf = x.astype('float') - self.xm
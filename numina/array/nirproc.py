@@ -15,7 +15,7 @@ import numpy
 
 def fowler_array(fowlerdata, ti=0.0, ts=0.0, gain=1.0, ron=1.0,
                  badpixels=None, dtype='float64',
-                 saturation=65631, blank=0, normalize=False):
+                 saturation=65631, blank=0, normalize=False, nproc=1):
     """Loop over the first axis applying Fowler processing.
 
     *fowlerdata* is assumed to be a 3D numpy.ndarray containing the
@@ -67,6 +67,7 @@ def fowler_array(fowlerdata, ti=0.0, ts=0.0, gain=1.0, ron=1.0,
     :param dtype: The dtype of the float outputs.
     :param saturation: The saturation level of the detector.
     :param blank: Invalid values in output are substituted by *blank*.
+    :param nproc: Number of worker processes used to split the image rows.
     :returns: A tuple of (signal, variance of the signal, numper of pixels used
         and badpixel mask.
     :raises: ValueError
@@ -117,6 +118,29 @@ def fowler_array(fowlerdata, ti=0.0, ts=0.0, gain=1.0, ron=1.0,
         if badpixels.dtype != mdtype:
             raise ValueError('dtype of badpixels must be uint8')
 
+    if nproc > 1:
+        # every pixel is reduced independently: fan the image rows out
+        # to worker processes and stitch the outputs back together
+        # (the Cython kernel does not release the GIL, so threads
+        # would not run in parallel)
+        from concurrent.futures import ProcessPoolExecutor
+
+        nproc = min(nproc, fshape[0])
+        chunks = numpy.array_split(numpy.arange(fshape[0]), nproc)
+        with ProcessPoolExecutor(max_workers=nproc) as executor:
+            futures = [
+                executor.submit(
+                    fowler_array, fowlerdata[:, sec[0]:sec[-1] + 1],
+                    ti=ti, ts=ts, gain=gain, ron=ron,
+                    badpixels=badpixels[sec[0]:sec[-1] + 1],
+                    dtype=dtype, saturation=saturation, blank=blank
+                )
+                for sec in chunks
+            ]
+            partial = [fut.result() for fut in futures]
+        return tuple(numpy.concatenate(out, axis=0)
+                     for out in zip(*partial))
+
     result = numpy.empty(fshape, dtype=fdtype)
     var = numpy.empty_like(result)
     npix = numpy.empty(fshape, dtype=mdtype)
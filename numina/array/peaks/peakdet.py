@@ -16,7 +16,7 @@ Functions to find peaks in 1D arrays and subpixel positions
 import numpy
 from numpy import dot
 from numpy.linalg import inv
-from scipy.ndimage.filters import generic_filter
+from scipy.ndimage import generic_filter
 from ._kernels import kernel_peak_function
 
 
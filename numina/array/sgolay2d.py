@@ -0,0 +1,105 @@
+#
+# Copyright 2021 Universidad Complutense de Madrid
+#
+# This file is part of Numina
+#
+# SPDX-License-Identifier: GPL-3.0+
+# License-Filename: LICENSE.txt
+#
+
+"""Two dimensional Savitzky-Golay filtering."""
+
+import functools
+
+import numpy
+import scipy.ndimage
+import scipy.signal
+
+# below this window size a direct convolution beats transforming
+# the whole frame
+_DIRECT_MAX_WINDOW = 15
+
+
+@functools.lru_cache(maxsize=64)
+def _sgolay2d_kernel(window_size, order, derivative=None):
+    """Convolution kernel(s) of the 2D Savitzky-Golay filter.
+
+    The kernel depends only on the window size, the polynomial order
+    and the requested derivative, so it is memoized: repeated filtering
+    with the same parameters skips the design-matrix build and the
+    pseudoinverse entirely.
+    """
+    n_terms = (order + 1) * (order + 2) // 2
+
+    if window_size % 2 == 0:
+        raise ValueError('window_size must be odd')
+
+    if window_size ** 2 < n_terms:
+        raise ValueError('order is too high for the window size')
+
+    half = window_size // 2
+
+    # exponents of the polynomial terms,
+    # p(x, y) = sum c_i * x**e[0] * y**e[1]
+    exps = [(k - n, n) for k in range(order + 1) for n in range(k + 1)]
+
+    ind = numpy.arange(-half, half + 1, dtype='float64')
+    dx = numpy.repeat(ind, window_size)
+    dy = numpy.tile(ind, window_size)
+
+    mat = numpy.empty((window_size ** 2, len(exps)))
+    for i, exp in enumerate(exps):
+        mat[:, i] = dx ** exp[0] * dy ** exp[1]
+
+    minv = numpy.linalg.pinv(mat)
+
+    def row(i):
+        return minv[i].reshape((window_size, window_size))
+
+    if derivative is None:
+        return (row(0),)
+    elif derivative == 'row':
+        return (-row(1),)
+    elif derivative == 'col':
+        return (-row(2),)
+    elif derivative == 'both':
+        return (-row(1), -row(2))
+    else:
+        raise ValueError(f'invalid derivative {derivative!r}')
+
+
+def sgolay2d(z, window_size, order, derivative=None):
+    """Smooth a 2D array with a Savitzky-Golay filter.
+
+    A polynomial surface of the given order is fitted, by linear least
+    squares, to the window around each pixel; the pixel is replaced by
+    the value of the surface (or of one of its first derivatives) at
+    the window center. The fit reduces to a convolution with a fixed
+    kernel, which is cached across calls.
+
+    :param z: 2D array to filter
+    :param window_size: odd size of the fitting window
+    :param order: order of the fitted polynomial
+    :param derivative: None for smoothing, 'row', 'col' or 'both'
+        for the first derivatives
+    :return: the filtered array, or a tuple (row, col) of derivative
+        arrays if derivative is 'both'
+    """
+    kernels = _sgolay2d_kernel(window_size, order, derivative)
+
+    if window_size <= _DIRECT_MAX_WINDOW:
+        # small kernel: a direct convolution touches each pixel
+        # window_size**2 times, much cheaper than FFTs of the full
+        # frame; 'mirror' matches the reflection padding below
+        res = tuple(scipy.ndimage.convolve(z, kern, mode='mirror')
+                    for kern in kernels)
+    else:
+        half = window_size // 2
+        # borders are handled by reflection, the padded array is
+        # shared between both convolutions in the 'both' case
+        zp = numpy.pad(z, half, mode='reflect')
+        res = tuple(scipy.signal.oaconvolve(zp, kern, mode='valid')
+                    for kern in kernels)
+    if len(res) == 1:
+        return res[0]
+    return res
@@ -124,6 +124,58 @@ class FixpixTestCase(unittest.TestCase):
             self.assertAlmostEqual(i, v)
 
 
+class Fixpix2TestCase(unittest.TestCase):
+    def test_plane_recovery(self):
+        # A plane is recovered exactly inside the masked regions
+        y, x = numpy.mgrid[0:32, 0:32]
+        data = (3.0 + 0.5 * x - 0.25 * y).astype('float64')
+        mask = numpy.zeros((32, 32), dtype='uint8')
+        mask[5:8, 10:13] = 1
+        mask[20, 25:29] = 1
+        mask[0:2, 0:2] = 1
+
+        expected = data.copy()
+        data[mask != 0] = -5000.0
+        data2 = array.fixpix2(data, mask)
+
+        self.assertTrue(numpy.allclose(data2, expected))
+        # Input is untouched, the fix happens in a copy
+        self.assertEqual(data[5, 10], -5000.0)
+
+    def test_no_defects(self):
+        data = numpy.ones((10, 10))
+        mask = numpy.zeros((10, 10))
+
+        data2 = array.fixpix2(data, mask)
+        self.assertTrue(numpy.allclose(data2, data))
+
+
+class MedianAxis0TestCase(unittest.TestCase):
+    def test_against_ma_median(self):
+        rng = numpy.random.RandomState(18492)
+        stack = rng.normal(100, 10, (5, 16, 16))
+        masks = (rng.uniform(size=(5, 16, 16)) > 0.8).astype('uint8')
+        # keep at least one valid value per pixel
+        masks[0] = 0
+
+        result = array.median_axis0(list(stack), masks=list(masks))
+        expected = numpy.ma.median(
+            numpy.ma.masked_array(stack, mask=masks), axis=0)
+
+        self.assertTrue(numpy.allclose(result, expected))
+
+
+class ExtinctionScalesTestCase(unittest.TestCase):
+    def test_values(self):
+        scales = array.extinction_scales([1.0, 1.5, 2.0], 0.2)
+        expected = [10 ** (0.4 * 0.2 * a) for a in [1.0, 1.5, 2.0]]
+        self.assertTrue(numpy.allclose(scales, expected))
+
+    def test_zero_extinction(self):
+        scales = array.extinction_scales([1.0, 1.2], 0.0)
+        self.assertTrue(numpy.allclose(scales, 1.0))
+
+
 def test_suite():
     suite = unittest.TestSuite()
     suite.addTest(unittest.makeSuite(ArrayTestCase))
@@ -5,6 +5,7 @@ import pytest
 
 from ..background import background_estimator
 from ..background import create_background_map
+from ..background import smooth_fft_lowpass
 
 
 def test_back1():
@@ -35,6 +36,22 @@ def test_back_crowded():
     assert numpy.allclose(r, res)
 
 
+def test_smooth_fft_lowpass_constant():
+    data = 300 * numpy.ones((64, 64))
+    smoothed = smooth_fft_lowpass(data, sigma=5.0)
+    assert numpy.allclose(smoothed, data)
+
+
+def test_smooth_fft_lowpass_gaussian():
+    import scipy.ndimage
+    numpy.random.seed(seed=938483)
+    data = numpy.random.normal(1100, 32, (64, 64))
+    smoothed = smooth_fft_lowpass(data, sigma=3.0)
+    res = scipy.ndimage.gaussian_filter(data, sigma=3.0,
+                                        mode='wrap', truncate=10.0)
+    assert numpy.allclose(smoothed, res, atol=1e-6)
+
+
 @pytest.mark.xfail
 def test_background_map():
     numpy.random.seed(seed=938483)
@@ -217,6 +217,36 @@ class CombineTestCase(unittest.TestCase):
         for cal, precal in zip(out[2].flat, itertools.repeat(5)):
             self.assertEqual(cal, precal)
 
+    def test_stacked_input(self):
+        """Combination of a stacked 3D array equals the list of its planes."""
+        inputs = [numpy.array([[1, 2], [3, 4]]) + i for i in range(5)]
+        masks = [numpy.zeros((2, 2), dtype='uint8') for _ in inputs]
+        masks[0][0, 0] = 1
+
+        stacked = numpy.stack(inputs)
+        mstacked = numpy.stack(masks)
+
+        out_list = c.median(inputs, masks=masks)
+        out_stack = c.median(stacked, masks=mstacked)
+
+        for cal, precal in zip(out_stack.flat, out_list.flat):
+            self.assertAlmostEqual(cal, precal)
+
+    def test_tiled_combine(self):
+        """Tiled combination equals the whole-frame combination."""
+        rng = numpy.random.RandomState(98123)
+        inputs = [rng.normal(100, 10, (37, 16)) for _ in range(5)]
+        masks = [(rng.uniform(size=(37, 16)) > 0.9).astype('uint8')
+                 for _ in inputs]
+        scales = [1.0, 1.1, 0.9, 1.2, 1.0]
+
+        full = c.median(inputs, masks=masks, scales=scales)
+        tiled = c.tiled_combine(_c.median_method(), inputs, masks=masks,
+                                scales=scales, tilerows=8)
+
+        for cal, precal in zip(tiled.flat, full.flat):
+            self.assertAlmostEqual(cal, precal)
+
     def test_median2(self):
         """Median combine: combination an even number of integer arrays."""
         # Inputs
@@ -0,0 +1,108 @@
+
+import numpy
+import pytest
+
+from ..distortion import compute_distortion, fmap, ncoef_fmap, \
+    order_fmap, rectify2d
+
+
+def _fmap_reference(order, aij, bij, x, y):
+    # direct evaluation of the double sum, term by term
+    u = numpy.zeros_like(x)
+    v = numpy.zeros_like(y)
+    k = 0
+    for i in range(order + 1):
+        for j in range(i + 1):
+            u += aij[k] * (x ** (i - j)) * (y ** j)
+            v += bij[k] * (x ** (i - j)) * (y ** j)
+            k += 1
+    return u, v
+
+
+@pytest.mark.parametrize("order", [1, 2, 3, 4])
+def test_fmap_matches_direct_sum(order):
+    rng = numpy.random.RandomState(order)
+    ncoef = (order + 1) * (order + 2) // 2
+    aij = rng.normal(size=ncoef)
+    bij = rng.normal(size=ncoef)
+    x = rng.uniform(0, 100, 57)
+    y = rng.uniform(0, 100, 57)
+
+    u, v = fmap(order, aij, bij, x, y)
+    u_ref, v_ref = _fmap_reference(order, aij, bij, x, y)
+
+    assert numpy.allclose(u, u_ref)
+    assert numpy.allclose(v, v_ref)
+
+
+def test_fmap_scalar():
+    aij = numpy.array([1.0, 2.0, 3.0])
+    bij = numpy.array([-1.0, 0.5, 0.25])
+    u, v = fmap(1, aij, bij, 2.0, 4.0)
+    assert numpy.allclose(u, 1.0 + 2.0 * 2.0 + 3.0 * 4.0)
+    assert numpy.allclose(v, -1.0 + 0.5 * 2.0 + 0.25 * 4.0)
+
+
+@pytest.mark.parametrize("order", [1, 2, 3, 4])
+def test_compute_distortion_roundtrip(order):
+    # a fit of points generated with a known transformation must
+    # reproduce the original coordinates
+    rng = numpy.random.RandomState(order + 100)
+    ncoef = (order + 1) * (order + 2) // 2
+    aij = numpy.zeros(ncoef)
+    bij = numpy.zeros(ncoef)
+    aij[1] = 1.0
+    bij[2] = 1.0
+    aij += rng.normal(0, 1e-6, ncoef)
+    bij += rng.normal(0, 1e-6, ncoef)
+    x_rect = rng.uniform(1, 100, 200)
+    y_rect = rng.uniform(1, 100, 200)
+    x_orig, y_orig = fmap(order, aij, bij, x_rect, y_rect)
+
+    aij_fit, bij_fit = compute_distortion(x_orig, y_orig,
+                                          x_rect, y_rect, order, 0)
+
+    u, v = fmap(order, aij_fit, bij_fit, x_rect, y_rect)
+    assert numpy.allclose(u, x_orig, atol=1e-6)
+    assert numpy.allclose(v, y_orig, atol=1e-6)
+
+
+def test_rectify2d_nearest_identity_with_offsets():
+    rng = numpy.random.RandomState(7)
+    image2d = rng.normal(10, 2, (12, 15))
+    # identity transformation pasted into a larger output grid
+    aij = numpy.array([0.0, 1.0, 0.0])
+    bij = numpy.array([0.0, 0.0, 1.0])
+
+    rect = rectify2d(image2d, aij, bij, resampling=1,
+                     naxis1out=20, naxis2out=18, ioffx=2, ioffy=3)
+
+    expected = numpy.zeros((18, 20))
+    expected[3:15, 2:17] = image2d
+    assert numpy.allclose(rect, expected)
+
+
+def test_rectify2d_cubic_identity():
+    rng = numpy.random.RandomState(11)
+    image2d = rng.normal(10, 2, (12, 15))
+    aij = numpy.array([0.0, 1.0, 0.0])
+    bij = numpy.array([0.0, 0.0, 1.0])
+
+    rect = rectify2d(image2d, aij, bij, resampling=3)
+
+    # the identity transformation hits the original pixel centers
+    assert numpy.allclose(rect, image2d)
+
+
+def test_ncoef_order_roundtrip():
+    for order in [1, 2, 3, 4]:
+        ncoef = ncoef_fmap(order)
+        assert ncoef == (order + 1) * (order + 2) // 2
+        assert order_fmap(ncoef) == order
+
+
+def test_order_fmap_invalid():
+    # not a triangular count, or beyond the supported order
+    for ncoef in [2, 4, 21]:
+        with pytest.raises(ValueError):
+            order_fmap(ncoef)
@@ -10,6 +10,7 @@
 import unittest
 
 import numpy
+from numpy.testing import assert_array_equal, assert_array_almost_equal
 
 from numina.array.nirproc import fowler_array
 
@@ -18,13 +19,23 @@ MASK_SATURATION = 3
 
 
 class FowlerTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # load the compiled kernel once, so the first test does not
+        # pay the extension import
+        fowler_array(numpy.zeros((2, 1, 1), dtype='int32'),
+                     saturation=100, blank=0)
+
     def setUp(self):
         self.fdata = numpy.empty((10, 1, 1))
         rows = 3
         columns = 4
         self.emptybp = numpy.zeros((rows, columns), dtype='uint8')
-        self.data = numpy.arange(10, dtype='int32')
-        self.data = numpy.tile(self.data, (columns, rows, 1)).T
+        base = numpy.arange(10, dtype='int32')
+        # zero-stride view instead of a tiled copy; tests copy it only
+        # when the processing kernel needs a writable cube
+        self.data = numpy.broadcast_to(base.reshape((10, 1, 1)),
+                                       (10, rows, columns))
         self.blank = 1
         self.saturation = 65536
         self.sgain = 1.0
@@ -33,78 +44,68 @@ class FowlerTestCase(unittest.TestCase):
     def test_exception(self):
         '''Test we raise exceptions for invalid inputs in Fowler mode.'''
 
-        # Dimension must be 3
-        self.assertRaises(ValueError, fowler_array,
-                          numpy.empty((2,)))
-        self.assertRaises(ValueError, fowler_array,
-                          numpy.empty((2, 2)))
-        self.assertRaises(ValueError, fowler_array,
-                          numpy.empty((2, 3, 4, 5)))
-        # saturation in good shape
-        self.assertRaises(ValueError, fowler_array,
-                          self.fdata, saturation=-100)
-        self.assertRaises(ValueError, fowler_array,
-                          self.fdata, saturation=0)
-        # 0-axis must be even
-        self.assertRaises(ValueError, fowler_array,
-                          numpy.empty((5, 2, 0)))
-        # gain must be positive
-        self.assertRaises(ValueError, fowler_array,
-                          self.fdata, gain=-1.0)
-        self.assertRaises(ValueError, fowler_array,
-                          self.fdata, gain=0)
-        # RON must be positive
-        self.assertRaises(ValueError, fowler_array,
-                          self.fdata, ron=-1.0)
-        self.assertRaises(ValueError, fowler_array,
-                          self.fdata, ron=0)
+        cases = [
+            # Dimension must be 3
+            ('1d data', (numpy.empty((2,)),), {}),
+            ('2d data', (numpy.empty((2, 2)),), {}),
+            ('4d data', (numpy.empty((2, 3, 4, 5)),), {}),
+            # saturation in good shape
+            ('negative saturation', (self.fdata,), {'saturation': -100}),
+            ('zero saturation', (self.fdata,), {'saturation': 0}),
+            # 0-axis must be even
+            ('odd axis-0', (numpy.empty((5, 2, 0)),), {}),
+            # gain must be positive
+            ('negative gain', (self.fdata,), {'gain': -1.0}),
+            ('zero gain', (self.fdata,), {'gain': 0}),
+            # RON must be positive
+            ('negative ron', (self.fdata,), {'ron': -1.0}),
+            ('zero ron', (self.fdata,), {'ron': 0}),
+        ]
+        for case, args, kwargs in cases:
+            with self.subTest(case=case):
+                self.assertRaises(ValueError, fowler_array,
+                                  *args, **kwargs)
 
     def test_saturation0(self):
         '''Test we count correctly saturated pixels in Fowler mode.'''
 
         # No points
-        self.data[:] = 50000  # - 32768
+        self.data = numpy.full(self.data.shape, 50000,
+                               dtype='int32')  # - 32768
         saturation = 40000  # - 32767
 
         res = fowler_array(self.data, saturation=saturation, blank=self.blank)
 
         # Number of points
-        for nn in res[2].flat:
-            self.assertEqual(nn, 0)
+        assert_array_equal(res[2], 0)
 
         # Mask value
-        for n in res[3].flat:
-            self.assertEqual(n, MASK_SATURATION)
+        assert_array_equal(res[3], MASK_SATURATION)
 
         # Variance
-        for v in res[1].flat:
-            self.assertEqual(v, self.blank)
+        assert_array_equal(res[1], self.blank)
 
         # Values
-        for v in res[0].flat:
-            self.assertEqual(v, self.blank)
+        assert_array_equal(res[0], self.blank)
 
     def test_saturation1(self):
         '''Test we count correctly saturated pixels in Fowler mode.'''
 
         saturation = 50000
+        self.data = self.data.copy()
         self.data[7:, ...] = saturation
 
         res = fowler_array(self.data,
                            saturation=saturation,
                            blank=self.blank)
 
-        for nn in res[2].flat:
-            self.assertEqual(nn, 2)
+        assert_array_equal(res[2], 2)
 
-        for n in res[3].flat:
-            self.assertEqual(n, MASK_GOOD)
+        assert_array_equal(res[3], MASK_GOOD)
 
-        for v in res[1].flat:
-            self.assertAlmostEqual(v, 2.0/2)
+        assert_array_almost_equal(res[1], 2.0/2)
 
-        for v in res[0].flat:
-            self.assertAlmostEqual(v, 5)
+        assert_array_almost_equal(res[0], 5)
 
     def test_dtypes0(self):
         '''Test output is float64 by default'''
@@ -139,28 +140,24 @@ class FowlerTestCase(unittest.TestCase):
     def test_badpixel0(self):
         '''Test we ignore badpixels in Fowler mode.'''
         mask_val = 2
-        self.emptybp[...] = mask_val
+        badpixels = numpy.full(self.emptybp.shape, mask_val,
+                               dtype='uint8')
 
-        res = fowler_array(self.data,
+        res = fowler_array(self.data.copy(),
                            saturation=self.saturation,
-                           badpixels=self.emptybp,
+                           badpixels=badpixels,
                            blank=self.blank)
 
-        for nn in res[2].flat:
-            self.assertEqual(nn, 0)
+        assert_array_equal(res[2], 0)
 
-        for n in res[3].flat:
-            self.assertEqual(n, mask_val)
+        assert_array_equal(res[3], mask_val)
 
-        for v in res[1].flat:
-            self.assertEqual(v, self.blank)
+        assert_array_equal(res[1], self.blank)
 
-        for v in res[0].flat:
-            self.assertAlmostEqual(v, self.blank)
+        assert_array_almost_equal(res[0], self.blank)
 
     def test_badpixel1(self):
         '''Test we handle correctly None badpixel mask.'''
-        self.emptybp[...] = 0
         values = [2343, 2454, 2578, 2661, 2709, 24311, 24445,
                   24405, 24612, 24707]
         self.data = numpy.empty((10, 3, 4), dtype='int32')
@@ -174,19 +171,15 @@ class FowlerTestCase(unittest.TestCase):
                            badpixels=self.emptybp,
                            blank=self.blank)
 
-        for nn in res[2].flat:
-            self.assertEqual(nn, 5)
+        assert_array_equal(res[2], 5)
 
-        for n in res[3].flat:
-            self.assertEqual(n, 0)
+        assert_array_equal(res[3], 0)
 
         # We have ti = texp = ts =0
         # So the noise is 2*sigma / N_p
-        for v in res[1].flat:
-            self.assertAlmostEqual(v, 2.0 / 5)
+        assert_array_almost_equal(res[1], 2.0 / 5)
 
-        for v in res[0].flat:
-            self.assertAlmostEqual(v, mean)
+        assert_array_almost_equal(res[0], mean)
 
         self.emptybp = None
         res = fowler_array(self.data,
@@ -194,33 +187,38 @@ class FowlerTestCase(unittest.TestCase):
                            badpixels=self.emptybp,
                            blank=self.blank)
 
-        for nn in res[2].flat:
-            self.assertEqual(nn, 5)
+        assert_array_equal(res[2], 5)
 
-        for n in res[3].flat:
-            self.assertEqual(n, 0)
+        assert_array_equal(res[3], 0)
 
-        for v in res[1].flat:
-            self.assertAlmostEqual(v, 2.0/5)
+        assert_array_almost_equal(res[1], 2.0/5)
 
-        for v in res[0].flat:
-            self.assertAlmostEqual(v, mean)
+        assert_array_almost_equal(res[0], mean)
 
         res = fowler_array(self.data,
                            saturation=self.saturation,
                            blank=self.blank)
 
-        for nn in res[2].flat:
-            self.assertEqual(nn, 5)
+        assert_array_equal(res[2], 5)
+
+        assert_array_equal(res[3], 0)
+
+        assert_array_almost_equal(res[1], 2.0/5)
+
+        assert_array_almost_equal(res[0], mean)
 
-        for n in res[3].flat:
-            self.assertEqual(n, 0)
+    def test_nproc(self):
+        '''Test row-parallel processing matches the serial result.'''
+        rng = numpy.random.RandomState(13)
+        data = rng.randint(0, 40000, size=(6, 5, 4)).astype('int32')
 
-        for v in res[1].flat:
-            self.assertAlmostEqual(v, 2.0/5)
+        serial = fowler_array(data, saturation=self.saturation,
+                              blank=self.blank)
+        parallel = fowler_array(data, saturation=self.saturation,
+                                blank=self.blank, nproc=2)
 
-        for v in res[0].flat:
-            self.assertAlmostEqual(v, mean)
+        for ser, par in zip(serial, parallel):
+            assert_array_equal(ser, par)
 
     def test_badpixel2(self):
         '''Test we don't accept badpixel mask with incompatible shape.'''
@@ -250,14 +248,10 @@ class FowlerTestCase(unittest.TestCase):
                            saturation=self.saturation,
                            blank=self.blank)
 
-        for nn in res[2].flat:
-            self.assertEqual(nn, 5)
+        assert_array_equal(res[2], 5)
 
-        for n in res[3].flat:
-            self.assertEqual(n, 0)
+        assert_array_equal(res[3], 0)
 
-        for v in res[1].flat:
-            self.assertAlmostEqual(v, 2.0 / 5)
+        assert_array_almost_equal(res[1], 2.0 / 5)
 
-        for v in res[0].flat:
-            self.assertAlmostEqual(v, mean)
+        assert_array_almost_equal(res[0], mean)
@@ -0,0 +1,30 @@
+
+import numpy
+import pytest
+
+from ..imregister import phase_correlation
+
+
+def _gauss2d(shape, y0, x0, sigma=3.0):
+    y, x = numpy.mgrid[0:shape[0], 0:shape[1]]
+    return numpy.exp(-((y - y0) ** 2 + (x - x0) ** 2) / (2 * sigma ** 2))
+
+
+def test_phase_correlation_zero():
+    data = _gauss2d((64, 64), 30, 33)
+    offset = phase_correlation(data, data)
+    assert offset == (0, 0)
+
+
+@pytest.mark.parametrize("shift", [(5, 7), (-4, 2), (0, -9)])
+def test_phase_correlation_shift(shift):
+    data = _gauss2d((64, 64), 30, 33)
+    shifted = numpy.roll(data, shift, axis=(0, 1))
+    offset = phase_correlation(data, shifted)
+    assert offset == shift
+
+
+def test_phase_correlation_shape_mismatch():
+    data = numpy.zeros((8, 8))
+    with pytest.raises(ValueError):
+        phase_correlation(data, numpy.zeros((8, 9)))
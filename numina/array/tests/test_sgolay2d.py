@@ -0,0 +1,49 @@
+
+import numpy
+import pytest
+
+from ..sgolay2d import sgolay2d, _sgolay2d_kernel
+
+
+@pytest.fixture
+def quadratic():
+    y, x = numpy.mgrid[0:32, 0:32].astype('float64')
+    return 2.0 + 0.5 * x - 0.25 * y + 0.03 * x * y + 0.01 * x ** 2
+
+
+def test_smoothing_preserves_polynomial(quadratic):
+    result = sgolay2d(quadratic, window_size=5, order=2)
+    # away from the borders the fit reproduces the surface exactly
+    interior = (slice(4, -4), slice(4, -4))
+    assert numpy.allclose(result[interior], quadratic[interior])
+
+
+def test_derivatives(quadratic):
+    dy, dx = sgolay2d(quadratic, window_size=5, order=2, derivative='both')
+    y, x = numpy.mgrid[0:32, 0:32].astype('float64')
+    interior = (slice(4, -4), slice(4, -4))
+    assert numpy.allclose(dx[interior], (0.5 + 0.03 * y + 0.02 * x)[interior])
+    assert numpy.allclose(dy[interior], (-0.25 + 0.03 * x)[interior])
+
+
+def test_smoothing_reduces_noise():
+    rng = numpy.random.RandomState(203)
+    data = rng.normal(10.0, 1.0, (64, 64))
+    result = sgolay2d(data, window_size=7, order=2)
+    assert result.std() < data.std()
+
+
+def test_kernel_is_cached():
+    kern1 = _sgolay2d_kernel(5, 2)
+    kern2 = _sgolay2d_kernel(5, 2)
+    assert kern1[0] is kern2[0]
+
+
+def test_invalid_parameters():
+    data = numpy.zeros((16, 16))
+    with pytest.raises(ValueError):
+        sgolay2d(data, window_size=4, order=2)
+    with pytest.raises(ValueError):
+        sgolay2d(data, window_size=3, order=4)
+    with pytest.raises(ValueError):
+        sgolay2d(data, window_size=5, order=2, derivative='bad')
@@ -94,7 +94,7 @@ def collapsed_spectrum(fitsfile, ns1, ns2,
 
         # fit and subtract background
         if nwin_background > 0:
-            background = ndimage.filters.median_filter(
+            background = ndimage.median_filter(
                 sp, size=nwin_background
             )
             sp -= background
@@ -272,7 +272,7 @@ def find_fxpeaks(sp,
 
     # apply gaussian filtering when requested
     if sigma_gaussian_filtering > 0:
-        spf = ndimage.filters.gaussian_filter(
+        spf = ndimage.gaussian_filter(
             sp,
             sigma=sigma_gaussian_filtering
         )
@@ -722,7 +722,7 @@ def main(args=None):
 
     # apply gaussian filtering
     if args.sigma_gauss_filt > 0:
-        spf = ndimage.filters.gaussian_filter(
+        spf = ndimage.gaussian_filter(
             sp,
             sigma=args.sigma_gauss_filt
         )
@@ -46,6 +46,30 @@ class BaseDictDAL(AbsDrpDAL):
         self.req_table = req_table
         self.extra_data = extra_data if extra_data else {}
         self.components = components if components else {}
+        # Per-instrument indices over prod_table, built lazily
+        self._prod_cache = {}
+
+    def _prod_index(self, ins):
+        """Return (by_obsid, by_label) indices for instrument 'ins'.
+
+        The indices are built on first use and rebuilt if the number
+        of stored products changes, so tables that grow during a run
+        (see Backend.new_product) are picked up.
+        """
+        ins_prod = self.prod_table.get(ins, [])
+        cached = self._prod_cache.get(ins)
+        if cached is not None and cached[0] == len(ins_prod):
+            return cached[1], cached[2]
+
+        by_obsid = {}
+        by_label = {}
+        for prod in ins_prod:
+            # keep only the first product per OB, as the linear scan did
+            by_obsid.setdefault(prod['ob'], prod)
+            by_label.setdefault(prod['type'], []).append(prod)
+
+        self._prod_cache[ins] = (len(ins_prod), by_obsid, by_label)
+        return by_obsid, by_label
 
     def search_oblock_from_id(self, obsid):
         try:
@@ -56,14 +80,11 @@ class BaseDictDAL(AbsDrpDAL):
 
     def search_prod_obsid(self, ins, obsid, pipeline):
         """Returns the first coincidence..."""
-        ins_prod = self.prod_table.get(ins, [])
+        by_obsid, _ = self._prod_index(ins)
 
-        # search results of these OBs
-        for prod in ins_prod:
-            if prod['ob'] == obsid:
-                # We have found the result, no more checks
-                return StoredProduct(**prod)
-        else:
+        try:
+            return StoredProduct(**by_obsid[obsid])
+        except KeyError:
             raise NoResultFound(f'result for ob {obsid} not found')
 
     def search_prod_req_tags(self, req, ins, tags, pipeline):
@@ -86,12 +107,14 @@ class BaseDictDAL(AbsDrpDAL):
         else:
             label_alt = label
 
-        # search results of these OBs
-        ptable = self.prod_table.get(ins, [])
-        for prod in ptable:
-            pk = prod['type'] 
-            pt = prod['tags']
-            if ((pk == label) or (pk == label_alt)) and tags_are_valid(pt, tags):
+        # only the products stored under this label can match
+        _, by_label = self._prod_index(ins)
+        candidates = by_label.get(label, [])
+        if label_alt != label:
+            candidates = chain(candidates, by_label.get(label_alt, []))
+
+        for prod in candidates:
+            if tags_are_valid(prod['tags'], tags):
                 # this is a valid product
                 # We have found the result, no more checks
                 # Make a copy
@@ -181,21 +181,17 @@ class DataModel(object):
     def get_darktime(self, img):
         """Obtain DARKTIME"""
         header = self.get_header(img)
-        if 'DARKTIME' in header.keys():
-            return header['DARKTIME']
-        else:
+        dtime = header.get('DARKTIME')
+        if dtime is None:
             return self.get_exptime(img)
+        return dtime
 
     def get_exptime(self, img):
         """Obtain EXPTIME"""
         header = self.get_header(img)
-        if 'EXPTIME' in header.keys():
-            etime = header['EXPTIME']
-
-        elif 'EXPOSED' in header.keys():
-            etime = header['EXPOSED']
-        else:
-            etime = 1.0
+        etime = header.get('EXPTIME')
+        if etime is None:
+            etime = header.get('EXPOSED', 1.0)
         return etime
 
     def do_sky_correction(self, img):
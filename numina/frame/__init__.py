@@ -26,7 +26,10 @@ def custom_slice_to_str(slc):
 
 
 def custom_region_to_str(region):
-    jints = [custom_slice_to_str(slc) for slc in region]
+    # formatting inlined to skip a function call per slice
+    jints = (f'{slc.start:d}:{slc.stop:d}' if slc.step is None
+             else f'{slc.start:d}:{slc.stop:d}:{slc.step:d}'
+             for slc in region)
     return '[' + ','.join(jints) + ']'
 
 
@@ -52,19 +55,16 @@ def resize_hdu(hdu, newshape, region, window=None, fill=0.0,
 def resize_hdul(hdul, newshape, region, extensions=None, window=None,
                 scale=1, fill=0.0, conserve=True):
     from numina.frame import resize_hdu
-    if extensions is None:
-        extensions = [0]
-
-    nhdul = [None] * len(hdul)
-    for ext, hdu in enumerate(hdul):
-        if ext in extensions:
-            nhdul[ext] = resize_hdu(hdu, newshape,
-                                    region, fill=fill,
-                                    window=window,
-                                    scale=scale,
-                                    conserve=conserve)
-        else:
-            nhdul[ext] = hdu
+    # set membership instead of a list scan per extension
+    extset = {0} if extensions is None else set(extensions)
+
+    # untouched extensions keep the original HDU, so their data is
+    # never forced to load
+    nhdul = [resize_hdu(hdu, newshape, region, fill=fill,
+                        window=window, scale=scale,
+                        conserve=conserve)
+             if ext in extset else hdu
+             for ext, hdu in enumerate(hdul)]
     return fits.HDUList(nhdul)
 
 
@@ -73,7 +73,10 @@ def resize_fits(fitsfile, newfilename, newshape, region, window=None,
 
     close_on_exit = False
     if isinstance(fitsfile, str):
-        hdulist = fits.open(fitsfile, mode='readonly')
+        # the data is copied straight into the resized buffer, so map
+        # the file instead of reading it eagerly
+        hdulist = fits.open(fitsfile, mode='readonly', memmap=True,
+                            lazy_load_hdus=True)
         close_on_exit = True
     else:
         hdulist = fitsfile
@@ -23,9 +23,9 @@ def _m_base(calc, img, mask, region):
     full_f = img[0].data
     arr = full_f[region]
     if mask is not None:
-        mask_sub = mask[region]
-        invalid = (mask_sub > 0)
-        arr = arr[~invalid]
+        # select the valid pixels directly, without materialising
+        # an 'invalid' plane and its negation
+        arr = arr[mask[region] == 0]
     return calc(arr)
 
 
@@ -34,7 +34,14 @@ def _m_mean(img, mask, region):
 
 
 def _m_median(img, mask, region):
-    return _m_base(numpy.median, img, mask, region)
+    full_f = img[0].data
+    arr = full_f[region]
+    if mask is not None:
+        # the compacted selection is a fresh buffer already, so the
+        # median can partition it in place instead of sorting a copy
+        arr = arr[mask[region] == 0]
+        return numpy.median(arr, overwrite_input=True)
+    return numpy.median(arr)
 
 
 def _m_mode(img, mask, region):
@@ -1,8 +1,10 @@
 
+import os
+
 import astropy.io.fits as fits
 import numpy
 
-from numina.frame.utils import copy_img
+from numina.frame.utils import copy_img, load_data_cached
 
 
 def test_copy_img():
@@ -23,3 +25,23 @@ def test_copy_img():
     for i in range(3):
         assert numpy.allclose(hdul[i].data, hdul_copy[i].data)
         assert hdul[i].header == hdul_copy[i].header
+
+
+def test_load_data_cached(tmpdir):
+
+    fname = str(tmpdir.join('master.fits'))
+    fits.PrimaryHDU(data=numpy.arange(6).reshape((2, 3))).writeto(fname)
+
+    data1 = load_data_cached(fname)
+    data2 = load_data_cached(fname)
+
+    assert data1 is data2
+    assert numpy.allclose(data1, numpy.arange(6).reshape((2, 3)))
+
+    # rewriting the file invalidates the cached entry
+    fits.PrimaryHDU(data=numpy.zeros((2, 3))).writeto(fname, overwrite=True)
+    os.utime(fname, (0, os.path.getmtime(fname) + 10))
+
+    data3 = load_data_cached(fname)
+    assert data3 is not data1
+    assert numpy.allclose(data3, 0.0)
@@ -9,9 +9,31 @@
 
 """Frame utils"""
 
+import functools
+import os
+
 import astropy.io.fits as fits
 
 
 def copy_img(img):
     """Copy an HDUList"""
-    return fits.HDUList([hdu.copy() for hdu in img])
\ No newline at end of file
+    return fits.HDUList([hdu.copy() for hdu in img])
+
+
+@functools.lru_cache(maxsize=8)
+def _load_data_cached(filename, mtime):
+    # mtime is part of the key: a file rewritten on disk gets a
+    # fresh cache entry
+    return fits.getdata(filename)
+
+
+def load_data_cached(filename):
+    """Load the primary data of a FITS file through a small cache.
+
+    Master calibrations are identical across the recipe invocations of
+    a batch job, but each invocation re-read them from disk. The cache
+    is keyed by file name and modification time, so sequential runs
+    reuse the parsed array while an updated file invalidates its
+    entry.
+    """
+    return _load_data_cached(filename, os.path.getmtime(filename))
\ No newline at end of file
@@ -15,7 +15,7 @@ from numina.instrument.simulation.efficiency import Efficiency
 
 class VirtualDetector(object):
     """Each of the channels."""
-    def __init__(self, base, geom, directfun, readpars):
+    def __init__(self, base, geom, directfun, readpars, rng=None):
 
         self.base = base
         self.trim, self.pcol, self.ocol, self.orow = geom
@@ -24,28 +24,40 @@ class VirtualDetector(object):
 
         self.readpars = readpars
 
+        # a Generator samples noticeably faster than the legacy
+        # global RandomState functions
+        self._rng = rng if rng is not None else numpy.random.default_rng()
+
     def readout_in_buffer(self, elec, final):
 
         final[self.trim] = self.direcfun(elec[self.base])
 
-        final[self.trim] = final[self.trim] / self.readpars.gain
+        final[self.trim] /= self.readpars.gain
 
         # We could use different RON and BIAS in each section
+        # the bias is folded into the mean of the noise draw, so each
+        # section is updated in a single pass
         for section in [self.trim, self.pcol, self.ocol, self.orow]:
-            final[section] = self.readpars.bias + numpy.random.normal(final[section], self.readpars.ron)
+            final[section] += self._rng.normal(self.readpars.bias, self.readpars.ron, final[section].shape)
 
         return final
 
 
 class DetectorBase(HWDevice):
-    def __init__(self, name, shape, qe=1.0, qe_wl=None, dark=0.0):
+    def __init__(self, name, shape, qe=1.0, qe_wl=None, dark=0.0, rng=None):
 
         super(DetectorBase, self).__init__(name)
 
+        self._rng = rng if rng is not None else numpy.random.default_rng()
+
         self.dshape = shape
         self.pixscale = 15.0e-3
 
-        self._det = numpy.zeros(shape, dtype='float64')
+        # float32 is enough precision for a readout quantized to
+        # uint16 and halves the memory traffic of expose/reset
+        self._det = numpy.zeros(shape, dtype='float32')
+        # persistent scratch for expose, reused across frames
+        self._elec = numpy.empty(shape, dtype='float32')
 
         self.qe = qe
 
@@ -64,7 +76,11 @@ class DetectorBase(HWDevice):
 
     def expose(self, source=0.0, time=0.0):
         self._time_last = time
-        self._det += (self.qe * source + self.dark) * time
+        # accumulate through the scratch buffer instead of allocating
+        # intermediates for every frame
+        numpy.multiply(source, self.qe * time, out=self._elec)
+        self._elec += self.dark * time
+        self._det += self._elec
 
     def reset(self):
         """Reset the detector."""
@@ -75,7 +91,7 @@ class DetectorBase(HWDevice):
 
     def simulate_poisson_variate(self):
         elec_mean = self._det
-        elec = numpy.random.poisson(elec_mean)
+        elec = self._rng.poisson(elec_mean)
         return elec
 
     def pre_readout(self, elec_pre):
@@ -85,7 +101,8 @@ class DetectorBase(HWDevice):
         return elec_f
 
     def post_readout(self, adu_r):
-        adu_p = numpy.clip(adu_r, 0, 2**16-1)
+        # clip in place, the buffer is local to readout()
+        adu_p = numpy.clip(adu_r, 0, 2**16-1, out=adu_r)
         return adu_p.astype('uint16')
 
     def clean_up(self):
@@ -11,6 +11,10 @@ import math
 from astropy.modeling.functional_models import Gaussian2D, Moffat2D
 
 
+# Ratio between the FWHM and sigma of a Gaussian profile
+FWHM_G = 2 * math.sqrt(2 * math.log(2))
+
+
 class AtmosphereModel(object):
 
     def __init__(self, twilight, nightsky, seeing, extinction, refraction):
@@ -64,7 +68,6 @@ class ConstSeeing(object):
 
 def generate_gaussian_profile(seeing_fwhm):
     """Generate a normalized Gaussian profile from its FWHM"""
-    FWHM_G = 2 * math.sqrt(2 * math.log(2))
     sigma = seeing_fwhm / FWHM_G
     amplitude = 1.0 / (2 * math.pi * sigma * sigma)
     seeing_model = Gaussian2D(amplitude=amplitude,
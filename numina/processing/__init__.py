@@ -16,6 +16,8 @@ import warnings
 
 from astropy.io import fits
 
+import numpy
+
 import numina.array as array
 import numina.util.node as node
 import numina.datamodel as dm
@@ -95,7 +97,12 @@ class BadPixelCorrector(Corrector):
 
         super(BadPixelCorrector, self).__init__(datamodel, calibid, dtype)
 
-        self.bpm = badpixelmask
+        # normalize the mask to binary uint8 once, so each corrected
+        # frame skips the per-call thresholding and the mask moves
+        # a single byte per pixel
+        self.bpm = numpy.asarray(badpixelmask)
+        if self.bpm.dtype != numpy.uint8:
+            self.bpm = (self.bpm > 0).astype('uint8')
         self.hwin = hwin
         self.wwin = wwin
 
@@ -128,9 +135,11 @@ class BiasCorrector(Corrector):
         self.update_variance = True if biasvar else False
 
         super(BiasCorrector, self).__init__(datamodel=datamodel, calibid=calibid, dtype=dtype)
-        self.bias_stats = biasmap.mean()
-        self.biasmap = biasmap
-        self.biasvar = biasvar
+        # keep the calibration maps in the working dtype, so each
+        # correction runs in one pass without promoting to float64
+        self.biasmap = numpy.asarray(biasmap, dtype=self.dtype)
+        self.bias_stats = self.biasmap.mean()
+        self.biasvar = biasvar if biasvar is None else numpy.asarray(biasvar, dtype=self.dtype)
 
     def run(self, img):
 
@@ -172,9 +181,12 @@ class DarkCorrector(Corrector):
                                             calibid=calibid,
                                             dtype=dtype)
 
-        self.dark_stats = darkmap.mean()
-        self.darkmap = darkmap
-        self.darkvar = darkvar
+        self.darkmap = numpy.asarray(darkmap, dtype=self.dtype)
+        self.dark_stats = self.darkmap.mean()
+        # scratch buffer for the exposure-scaled dark, reused
+        # across frames
+        self._scaled = numpy.empty_like(self.darkmap)
+        self.darkvar = darkvar if darkvar is None else numpy.asarray(darkvar, dtype=self.dtype)
 
     def run(self, img):
 
@@ -182,7 +194,7 @@ class DarkCorrector(Corrector):
 
         data = self.datamodel.get_data(img)
 
-        data -= self.darkmap * etime
+        data -= numpy.multiply(self.darkmap, etime, out=self._scaled)
         # FIXME
         img[0].data = data
 
@@ -239,8 +251,8 @@ class FlatFieldCorrector(Corrector):
             calibid=calibid,
             dtype=dtype)
 
-        self.flatdata = flatdata
-        self.flat_stats = flatdata.mean()
+        self.flatdata = numpy.asarray(flatdata, dtype=self.dtype)
+        self.flat_stats = self.flatdata.mean()
 
     def run(self, img):
         imgid = self.get_imgid(img)
@@ -249,7 +261,11 @@ class FlatFieldCorrector(Corrector):
         _logger.debug('flat mean is %f', self.flat_stats)
 
         data = self.datamodel.get_data(img)
-        data = array.correct_flatfield(data, self.flatdata, dtype=self.dtype)
+        # divide in place when the frame is already in the working
+        # dtype, instead of allocating a fresh output per frame
+        out = data if data.dtype == self.flatdata.dtype else None
+        data = array.correct_flatfield(data, self.flatdata,
+                                       dtype=self.dtype, out=out)
         # FIXME
         img[0].data = data
         hdr = img['primary'].header
@@ -272,8 +288,8 @@ class SkyCorrector(Corrector):
             calibid=calibid,
             dtype=dtype)
 
-        self.skydata = skydata
-        self.calib_stats = skydata.mean()
+        self.skydata = numpy.asarray(skydata, dtype=self.dtype)
+        self.calib_stats = self.skydata.mean()
 
     def run(self, img):
         imgid = self.get_imgid(img)
@@ -284,7 +300,9 @@ class SkyCorrector(Corrector):
 
             data = self.datamodel.get_data(img)
 
-            data = array.correct_sky(data, self.skydata, dtype=self.dtype)
+            out = data if data.dtype == self.skydata.dtype else None
+            data = array.correct_sky(data, self.skydata,
+                                     dtype=self.dtype, out=out)
 
             # FIXME
             img[0].data = data
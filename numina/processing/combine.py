@@ -25,23 +25,23 @@ from numina.datamodel import get_imgid
 def basic_processing_with_combination(
         rinput, reduction_flow,
         method=combine.mean, method_kwargs=None,
-        errors=True, prolog=None):
+        errors=True, prolog=None, scales=None, zeros=None):
 
     return basic_processing_with_combination_frames(
         rinput.obresult.frames, reduction_flow,
         method=method, method_kwargs=method_kwargs,
-        errors=errors, prolog=prolog
+        errors=errors, prolog=prolog, scales=scales, zeros=zeros
     )
 
 
 def basic_processing_with_combination_frames(
         frames, reduction_flow,
         method=combine.mean, method_kwargs=None,
-        errors=True, prolog=None):
+        errors=True, prolog=None, scales=None, zeros=None):
 
     result = combine_frames(
         frames, method=method, method_kwargs=method_kwargs,
-        errors=errors, prolog=prolog
+        errors=errors, prolog=prolog, scales=scales, zeros=zeros
     )
 
     hdulist = reduction_flow(result)
@@ -49,7 +49,8 @@ def basic_processing_with_combination_frames(
     return hdulist
 
 
-def combine_frames(frames, method=combine.mean, method_kwargs=None, errors=True, prolog=None):
+def combine_frames(frames, method=combine.mean, method_kwargs=None,
+                   errors=True, prolog=None, scales=None, zeros=None):
     """
 
     Parameters
@@ -59,6 +60,8 @@ def combine_frames(frames, method=combine.mean, method_kwargs=None, errors=True,
     method_kwargs
     errors
     prolog
+    scales
+    zeros
 
     Returns
     -------
@@ -69,13 +72,14 @@ def combine_frames(frames, method=combine.mean, method_kwargs=None, errors=True,
         hduls = [stack.enter_context(dframe.open()) for dframe in frames]
         result = combine_imgs(
             hduls, method=method, method_kwargs=method_kwargs,
-            errors=errors, prolog=prolog
+            errors=errors, prolog=prolog, scales=scales, zeros=zeros
         )
 
     return result
 
 
-def combine_imgs(hduls, method=combine.mean, method_kwargs=None, errors=True, prolog=None):
+def combine_imgs(hduls, method=combine.mean, method_kwargs=None,
+                 errors=True, prolog=None, scales=None, zeros=None):
     """
 
     Parameters
@@ -85,6 +89,11 @@ def combine_imgs(hduls, method=combine.mean, method_kwargs=None, errors=True, pr
     method_kwargs
     errors
     prolog
+    scales
+        Per-frame scale factors, applied inside the combine kernel
+        instead of prescaling N full frames.
+    zeros
+        Per-frame zero offsets, applied inside the combine kernel.
 
     Returns
     -------
@@ -104,6 +113,10 @@ def combine_imgs(hduls, method=combine.mean, method_kwargs=None, errors=True, pr
     method_kwargs = method_kwargs or {}
     if 'dtype' not in method_kwargs:
         method_kwargs['dtype'] = 'float32'
+    if scales is not None:
+        method_kwargs['scales'] = scales
+    if zeros is not None:
+        method_kwargs['zeros'] = zeros
 
     _logger.info(f"stacking {cnum:d} images using '{method.__name__}'")
     combined_data = method([d[0].data for d in hduls], **method_kwargs)
@@ -135,7 +148,7 @@ def combine_imgs(hduls, method=combine.mean, method_kwargs=None, errors=True, pr
     if errors:
         varhdu = fits.ImageHDU(combined_data[1], name='VARIANCE')
         result.append(varhdu)
-        num = fits.ImageHDU(combined_data[2].astype('int16'), name='MAP')
+        num = fits.ImageHDU(combined_data[2].astype('uint8'), name='MAP')
         result.append(num)
 
     return result
@@ -160,7 +173,10 @@ def main(args=None):
 
     errors = args.errors
     with contextlib.ExitStack() as stack:
-        hduls = [stack.enter_context(fits.open(fname)) for fname in args.image]
+        hduls = [stack.enter_context(fits.open(fname, mode='readonly',
+                                               memmap=True,
+                                               lazy_load_hdus=True))
+                 for fname in args.image]
         result = combine_imgs(hduls, method=method, errors=errors, prolog=None)
 
     result.writeto(args.output, overwrite=True)
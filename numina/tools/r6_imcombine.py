@@ -50,41 +50,33 @@ def compute_abba_result(list_of_fileinfo, outfile, extnum=0, noheader=False,
     naxis1 = 0
     naxis2 = 0
     image_header = None
+    result_ini = None
+    result_end = None
+    result = None
 
-    # check image dimensions
+    # read the four images once, checking dimensions on the fly,
+    # and compute the arithmetic combination
     for i in range(4):
-        hdulist = fits.open(list_of_fileinfo[i].filename)
-        if i == 0:
-            image_header = hdulist[extnum].header
-            naxis1 = image_header['naxis1']
-            naxis2 = image_header['naxis2']
-            hdulist.close()
-        else:
+        if abs(debugplot) >= 10:
+            print('Reading ' + list_of_fileinfo[i].filename + '...')
+        with fits.open(list_of_fileinfo[i].filename) as hdulist:
             image_header_ = hdulist[extnum].header
             naxis1_ = image_header_['naxis1']
             naxis2_ = image_header_['naxis2']
-            hdulist.close()
-            if naxis1 != naxis1_ or naxis2 != naxis2_:
-                print('>>> naxis1, naxis2..:', naxis1, naxis2)
-                print('>>> naxis1_, naxis2_:', naxis1_, naxis2_)
-                raise ValueError("Image dimensions do not agree!")
-
-    # initialize outpuf array(s)
-    if save_partial:
-        result_ini = np.zeros((naxis2, naxis1), dtype=np.float)
-        result_end = np.zeros((naxis2, naxis1), dtype=np.float)
-    else:
-        result_ini = None
-        result_end = None
-    result = np.zeros((naxis2, naxis1), dtype=np.float)
-
-    # read the four images and compute arithmetic combination
-    for i in range(4):
-        if abs(debugplot) >= 10:
-            print('Reading ' + list_of_fileinfo[i].filename + '...')
-        hdulist = fits.open(list_of_fileinfo[i].filename)
-        image2d = hdulist[extnum].data.astype(np.float)
-        hdulist.close()
+            image2d = hdulist[extnum].data.astype(float)
+        if i == 0:
+            image_header = image_header_
+            naxis1 = naxis1_
+            naxis2 = naxis2_
+            # initialize output array(s)
+            if save_partial:
+                result_ini = np.zeros((naxis2, naxis1), dtype=float)
+                result_end = np.zeros((naxis2, naxis1), dtype=float)
+            result = np.zeros((naxis2, naxis1), dtype=float)
+        elif naxis1 != naxis1_ or naxis2 != naxis2_:
+            print('>>> naxis1, naxis2..:', naxis1, naxis2)
+            print('>>> naxis1_, naxis2_:', naxis1_, naxis2_)
+            raise ValueError("Image dimensions do not agree!")
         if i == 0:
             if save_partial:
                 result_ini += image2d
@@ -110,15 +102,15 @@ def compute_abba_result(list_of_fileinfo, outfile, extnum=0, noheader=False,
     if save_partial:
         if abs(debugplot) >= 10:
             print("==> Generating output file: " + outfile + "_sub1.fits...")
-        hdu = fits.PrimaryHDU(result_ini.astype(np.float), image_header)
+        hdu = fits.PrimaryHDU(result_ini, image_header)
         hdu.writeto(outfile + '_sub1.fits', overwrite=True)
         if abs(debugplot) >= 10:
             print("==> Generating output file: " + outfile + "_sub2.fits...")
-        hdu = fits.PrimaryHDU(result_end.astype(np.float), image_header)
+        hdu = fits.PrimaryHDU(result_end, image_header)
         hdu.writeto(outfile + '_sub2.fits', overwrite=True)
     if abs(debugplot) >= 10:
         print("==> Generating output file: " + outfile + ".fits...")
-    hdu = fits.PrimaryHDU(result.astype(np.float), image_header)
+    hdu = fits.PrimaryHDU(result, image_header)
     hdu.writeto(outfile + '.fits', overwrite=True)
 
 
@@ -197,35 +189,16 @@ def main(args=None):
         # number of files to be combined
         number_of_files = len(list_of_files)
 
-        # declare auxiliary arrays to store image basic parameters
-        naxis1 = np.zeros(number_of_files, dtype=np.int)
-        naxis2 = np.zeros(number_of_files, dtype=np.int)
-
-        # read basic parameters for all the images
-        for i in range(number_of_files):
-            infile = list_of_files[i]
-            hdulist = fits.open(infile)
-            image_header = hdulist[extnum].header
-            hdulist.close()
-            naxis1[i] = image_header['naxis1']
-            naxis2[i] = image_header['naxis2']
-
-        # check that NAXIS1 is the same for all the images
-        naxis1_comp = np.repeat(naxis1[0], number_of_files)
-        if not np.allclose(naxis1, naxis1_comp):
-            raise ValueError("NAXIS1 values are different")
-
-        # check that NAXIS2 is the same for all the images
-        naxis2_comp = np.repeat(naxis2[0], number_of_files)
-        if not np.allclose(naxis2, naxis2_comp):
-            raise ValueError("NAXIS2 values are different")
-
         image_header_first_frame = None  # avoid PyCharm warning
         image2d = None                   # avoid PyCharm warning
 
-        if args.method in ['sum', 'mean']:
-            image2d = np.zeros((naxis2[0], naxis1[0]), dtype=np.float)
-            # add all the individual images
+        if args.method in ['sum', 'mean', 'median', 'sigmaclip']:
+            # read each file exactly once: headers and data come from
+            # the same open, and the dimension check is folded into
+            # the accumulation loop
+            image_shape = None
+            image3d = None
+            list_data = []
             for i in range(number_of_files):
                 infile = list_of_files[i]
                 print("<--" + infile + " (image " + str(i + 1) + " of " +
@@ -234,45 +207,36 @@ def main(args=None):
                 data = hdulist[extnum].data
                 if i == 0:
                     image_header_first_frame = hdulist[extnum].header
+                    image_shape = data.shape
+                    if args.method in ['sum', 'mean']:
+                        image2d = np.zeros(image_shape, dtype=float)
+                    elif args.method == 'median':
+                        # temporary cube to store all the images
+                        image3d = np.zeros(
+                            (number_of_files,) + image_shape, dtype=float)
+                elif data.shape[1] != image_shape[1]:
+                    raise ValueError("NAXIS1 values are different")
+                elif data.shape[0] != image_shape[0]:
+                    raise ValueError("NAXIS2 values are different")
+                if args.method in ['sum', 'mean']:
+                    image2d += data
+                elif args.method == 'median':
+                    image3d[i, :, :] = data
+                else:
+                    list_data.append(data)
                 hdulist.close()
-                image2d += data
-            # average result when required
+            # final reduction
             if args.method == 'mean':
                 image2d /= number_of_files
-        elif args.method == 'sigmaclip':
-            list_data = []
-            for i in range(number_of_files):
-                infile = list_of_files[i]
-                print("<--" + infile + " (image " + str(i + 1) + " of " +
-                      str(number_of_files) + ')')
-                hdulist = fits.open(infile)
-                data = hdulist[extnum].data
-                if i == 0:
-                    image_header_first_frame = hdulist[extnum].header
-                hdulist.close()
-                list_data.append(data)
-            if args.method_kwargs is None:
-                image2d = combine.sigmaclip(list_data)[0]
-            else:
-                method_kwargs = eval(args.method_kwargs)
-                image2d = combine.sigmaclip(list_data, **method_kwargs)[0]
-        elif args.method == 'median':
-            # declare temporary cube to store all the images
-            image3d = np.zeros((number_of_files, naxis2[0], naxis1[0]),
-                               dtype=np.float)
-            # read all the individual images
-            for i in range(number_of_files):
-                infile = list_of_files[i]
-                print("<--" + infile + " (image " + str(i + 1) + " of " +
-                      str(number_of_files) + ')')
-                hdulist = fits.open(infile)
-                data = hdulist[extnum].data
-                if i == 0:
-                    image_header_first_frame = hdulist[extnum].header
-                hdulist.close()
-                image3d[i, :, :] += data
-            # compute median
-            image2d = np.median(image3d, axis=0)
+            elif args.method == 'median':
+                image2d = np.median(image3d, axis=0, overwrite_input=True)
+            elif args.method == 'sigmaclip':
+                if args.method_kwargs is None:
+                    image2d = combine.sigmaclip(list_data)[0]
+                else:
+                    method_kwargs = eval(args.method_kwargs)
+                    image2d = combine.sigmaclip(list_data,
+                                                **method_kwargs)[0]
         elif args.method in ['abba', 'abba_partial']:
             save_partial = False
             if args.method == 'abba_partial':
@@ -306,7 +270,7 @@ def main(args=None):
             for i in range(number_of_files):
                 image_header.add_history(list_of_files[i])
             image_header.add_history("---")
-            hdu = fits.PrimaryHDU(image2d.astype(np.float), image_header)
+            hdu = fits.PrimaryHDU(image2d.astype(float), image_header)
             hdu.writeto(output_fits_filename, overwrite=(not args.noclobber))
 
 
@@ -24,7 +24,12 @@ class DataFrame(object):
 
     def open(self):
         if self.frame is None:
-            return fits.open(self.filename, mode='readonly')
+            # Force memory mapping and lazy HDU loading regardless of
+            # the global astropy configuration: this is the shared read
+            # path of the pipelines and repeated opens of the same file
+            # then reuse the kernel page cache instead of re-reading
+            return fits.open(self.filename, mode='readonly',
+                             memmap=True, lazy_load_hdus=True)
         else:
             return self.frame
 
@@ -8,7 +8,9 @@
 #
 
 import inspect
-import collections.abc
+from collections.abc import Iterable
+
+import numpy
 
 from numina.exceptions import ValidationError
 from .base import DataTypeBase
@@ -19,6 +21,15 @@ class DataType(DataTypeBase):
     """Base class for input/output types of recipes.
 
     """
+
+    _fqn = None
+
+    def __init_subclass__(cls, **kwds):
+        super().__init_subclass__(**kwds)
+        # bind the fully qualified name once per class instead of
+        # rebuilding it on every dialect call
+        cls._fqn = cls.__module__ + '.' + cls.__name__
+
     def __init__(self, ptype, node_type=None, default=None, **kwds):
         super(DataType, self).__init__(**kwds)
         self.node_type = node_type
@@ -68,7 +79,7 @@ class DataType(DataTypeBase):
         return True
 
     def add_dialect_info(self, dialect, tipo):
-        key = self.__module__ + '.' + self.__class__.__name__
+        key = self._fqn or (self.__module__ + '.' + self.__class__.__name__)
         result = {'fqn': key, 'python': self.internal_type, 'type': tipo}
         self.internal_dialect[dialect] = result
         return result
@@ -127,6 +138,14 @@ class PlainPythonType(DataType):
 
         super(PlainPythonType, self).__init__(stype, default=default)
 
+        # bind a converter specialized at construction time, so each
+        # call skips the branch on the validator
+        if self.custom_validator is None:
+            self.convert = stype
+        else:
+            custom_validator = self.custom_validator
+            self.convert = lambda obj: custom_validator(stype(obj))
+
     def convert(self, obj):
         pre = self.internal_type(obj)
 
@@ -167,20 +186,48 @@ class ListOfType(DataType):
             self.multi_query = multi_query
 
     def convert(self, obj):
-        if not isinstance(obj, collections.abc.Iterable):
+        if not isinstance(obj, Iterable):
             if self.accept_scalar:
                 obj = [obj]
             else:
                 raise TypeError("The object received should be iterable"
                                 " or the type modified to accept scalar values")
 
-        result = [self.node_type.convert(o) for o in obj]
+        node = self.node_type
+        if (isinstance(obj, (list, tuple)) and
+                isinstance(node, PlainPythonType) and
+                node.custom_validator is None and
+                node.internal_type in (int, float)):
+            # plain numeric elements without a custom validator can be
+            # cast in a single C loop instead of one convert per item;
+            # values numpy cannot represent (e.g. ints beyond 64 bits)
+            # drop to the per-element loop
+            try:
+                arr = numpy.asarray(obj, dtype=node.internal_type)
+            except (TypeError, ValueError, OverflowError):
+                pass
+            else:
+                if arr.ndim == 1:
+                    self.len_validator(arr.size)
+                    return arr.tolist()
+
+        result = [node.convert(o) for o in obj]
         self.len_validator(len(result))
         return result
 
     def validate(self, obj):
+        node = self.node_type
+        if (isinstance(node, PlainPythonType) and
+                node.custom_validator is None and
+                set(map(type, obj)) <= {node.internal_type}):
+            # homogeneous plain elements pass with one C-level scan of
+            # the types; anything else (subclasses, mixed content)
+            # falls through to the per-element check below
+            self.len_validator(len(obj))
+            return True
+
         for o in obj:
-            self.node_type.validate(o)
+            node.validate(o)
         self.len_validator(len(obj))
         return True
 
@@ -194,7 +241,7 @@ class ListOfType(DataType):
         return result
 
     def _datatype_load(self, objs):
-        if not isinstance(objs, collections.abc.Iterable):
+        if not isinstance(objs, Iterable):
             if self.accept_scalar:
                 objs = [objs]
             else:
@@ -7,11 +7,26 @@
 # License-Filename: LICENSE.txt
 #
 
+import functools
+
+
+@functools.lru_cache(maxsize=None)
+def _default_dialect_info_cached(key, internal_type):
+    return {'base': {'fqn': key, 'python': internal_type}}
+
 
 def default_dialect_info(obj):
-    key = obj.__module__ + '.' + obj.__class__.__name__
-    result = {'base': {'fqn': key, 'python': obj.internal_type}}
-    return result
+    key = getattr(obj, '_fqn', None)
+    if key is None:
+        key = obj.__module__ + '.' + obj.__class__.__name__
+    try:
+        # the mapping only depends on the class and its internal type;
+        # instances may grow entries through add_dialect_info, so each
+        # one gets a shallow copy of the shared result
+        return dict(_default_dialect_info_cached(key, obj.internal_type))
+    except TypeError:
+        # unhashable internal type, build the mapping directly
+        return {'base': {'fqn': key, 'python': obj.internal_type}}
 
 
 dialect_info = default_dialect_info
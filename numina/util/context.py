@@ -53,21 +53,19 @@ def manage_fits(list_of_frame):
     import astropy.io.fits as fits
     import numina.types.dataframe as df
 
-    refs = []
-    for frame in list_of_frame:
-        if isinstance(frame, str):
-            ref = fits.open(frame)
-            refs.append(ref)
-        elif isinstance(frame, fits.HDUList):
-            refs.append(frame)
-        elif isinstance(frame, df.DataFrame):
-            ref = frame.open()
+    # an ExitStack guarantees every resource is released, even if an
+    # open fails halfway through the list or one of the closes raises
+    with contextlib.ExitStack() as stack:
+        refs = []
+        for frame in list_of_frame:
+            if isinstance(frame, str):
+                ref = fits.open(frame)
+            elif isinstance(frame, fits.HDUList):
+                ref = frame
+            elif isinstance(frame, df.DataFrame):
+                ref = frame.open()
+            else:
+                ref = frame
+            stack.callback(ref.close)
             refs.append(ref)
-        else:
-            refs.append(frame)
-    try:
         yield refs
-    finally:
-        # release
-        for obj in refs:
-            obj.close()